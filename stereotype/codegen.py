@@ -0,0 +1,384 @@
+from __future__ import annotations
+
+from functools import lru_cache
+from keyword import iskeyword
+from types import CodeType
+from typing import Dict, Any, List, Callable, Type, Tuple, Iterable, Optional, TYPE_CHECKING
+
+from stereotype.fields.base import Field
+from stereotype.roles import Role
+from stereotype.utils import Missing, ConversionError, PathErrorType
+
+if TYPE_CHECKING:  # pragma: no cover
+    from stereotype.model import Model, _OutputFieldConfig
+
+_FALSY_EMPTY_TYPES = (bool, int, float, str, list, dict)
+_ATOMIC_TYPES = (bool, int, float, str)
+
+# Generated methods are specialized for a single Model class, with its field configuration inlined in their code.
+# This avoids interpreting the config tuples on every call, which is what the generic implementations in Model do.
+
+
+def compile_function(name: str, lines: List[str], namespace: Dict[str, Any]) -> Callable:
+    """Compiles the source lines of a function definition, the namespace becomes the function's globals."""
+    exec(_compile('\n'.join(lines), name), namespace)
+    return namespace[name]
+
+
+@lru_cache(maxsize=1024)
+def _compile(source: str, name: str) -> CodeType:
+    # Models with the same layout (e.g. subclasses adding no fields) generate the same source, differing only in the
+    # objects bound in the namespace, so the code can be shared
+    return compile(source, f'<stereotype {name}>', 'exec')
+
+
+def _constant(value: Any, name: str, namespace: Dict[str, Any]) -> str:
+    """An expression for the value, inlined if its repr evaluates back to it, otherwise bound in the namespace."""
+    # Not the case for str subclasses such as enums, which can be used as field names in input and output
+    if type(value) is str or (type(value) is tuple and all(type(item) is str for item in value)):
+        return repr(value)
+    namespace[name] = value
+    return name
+
+
+def get_attribute(obj: str, name: str) -> str:
+    """An expression reading the attribute, names that are keywords (e.g. from dynamic models) need getattr."""
+    if name.isidentifier() and not iskeyword(name):
+        return f'{obj}.{name}'
+    return f'getattr({obj}, {name!r})'
+
+
+def set_attribute(obj: str, name: str, value: str) -> str:
+    """A statement assigning the attribute, see `get_attribute`."""
+    if name.isidentifier() and not iskeyword(name):
+        return f'{obj}.{name} = {value}'
+    return f'setattr({obj}, {name!r}, {value})'
+
+
+def is_generated(function: Callable) -> bool:
+    return getattr(function, '__stereotype_generated__', False)
+
+
+def generate_init(cls: Type[Model], input_fields: List[Field],
+                  generic_init: Callable[[Model, Any], None]) -> Callable[[Model, Any], None]:
+    namespace = {'_cls': cls, '_generic_init': generic_init, '_Missing': Missing, '_empty': {},
+                 'ConversionError': ConversionError}
+    lines = [
+        'def __init__(self, raw_data=None):',
+        # Subclasses inherit this until initialized, also any subclass may call it via super().__init__
+        '    if type(self) is not _cls:',
+        '        return _generic_init(self, raw_data)',
+        '    if type(raw_data) is not dict:',
+        '        if raw_data is None:',
+        '            raw_data = _empty',
+        '        elif not isinstance(raw_data, dict):',
+        "            raise ConversionError.new(f'Supplied type {type(raw_data).__name__}, needs a mapping')",
+        '    get = raw_data.get',
+    ]
+    standard_converters = _standard_converters()
+    for index, (field, (name, primitive_name, convert, _)) in enumerate(zip(input_fields, cls.__input_fields__)):
+        namespace[f'_convert_{index}'] = convert
+        # Input is often sparse, missing values of built-in fields are filled without calling convert
+        fill = _fill_missing_expression(field, index, namespace) if type(field).convert in standard_converters else None
+        if primitive_name is None:
+            lines.append(f'    {set_attribute("self", name, fill or f"_convert_{index}(_Missing)")}')
+            continue
+        key = _constant(primitive_name, f'_key_{index}', namespace)
+        converted = [
+            '    try:',
+            f'        {set_attribute("self", name, f"_convert_{index}(get({key}, _Missing))")}',
+            '    except ConversionError as e:',
+            f'        raise e.prepend_path({key})',
+            '    except (TypeError, ValueError) as e:',
+            f'        raise ConversionError.new(str(e), {key})',
+        ]
+        if fill is None:
+            lines.extend(converted)
+            continue
+        converted[1] = f'        {set_attribute("self", name, f"_convert_{index}(value)")}'
+        lines.extend([
+            f'    value = get({key}, _Missing)',
+            '    if value is _Missing:',
+            f'        {set_attribute("self", name, fill)}',
+        ])
+        if field.type in _ATOMIC_TYPES:
+            # Built-in conversions of atomic fields return values of exactly the field's type unchanged
+            lines.extend([
+                f'    elif type(value) is {field.type.__name__}:',
+                f'        {set_attribute("self", name, "value")}',
+            ])
+        lines.extend([
+            '    else:',
+            *[f'    {line}' for line in converted],
+        ])
+    return _finalize(compile_function('__init__', lines, namespace), cls, generic_init)
+
+
+def _fill_missing_expression(field: Field, index: int, namespace: Dict[str, Any]) -> str:
+    """Inlines what the built-in fields' convert returns for a Missing value."""
+    if field.required:
+        return '_Missing'
+    if field.default_factory is not None:
+        namespace[f'_default_factory_{index}'] = field.default_factory
+        return f'_default_factory_{index}()'
+    if field.default is None:
+        return 'None'
+    namespace[f'_default_{index}'] = field.default
+    return f'_default_{index}'
+
+
+def generate_eq(cls: Type[Model], generic_eq: Callable[[Model, Any], bool]) -> Callable[[Model, Any], bool]:
+    """Generates comparison of all input fields, atomic fields (those without copy_value) are compared first."""
+    namespace = {'_cls': cls, '_generic_eq': generic_eq}
+    # Stable sort, so fields of the same cost are still compared in the order of declaration
+    names = [name for name, _, _, copy_value in sorted(cls.__input_fields__, key=lambda config: config[3] is not None)]
+    comparisons = ' or '.join(f'{get_attribute("self", name)} != {get_attribute("other", name)}' for name in names)
+    lines = [
+        'def __eq__(self, other):',
+        '    if type(self) is not _cls:',
+        '        return _generic_eq(self, other)',
+        '    if type(other) is not _cls:',
+        '        return False',
+        f'    return not ({comparisons})' if names else '    return True',
+    ]
+    return _finalize(compile_function('__eq__', lines, namespace), cls, generic_eq)
+
+
+def generate_hash(cls: Type[Model], generic_hash: Callable[[Model], int]) -> Callable[[Model], int]:
+    """Generates hashing of the model's type and atomic fields, consistent with __eq__."""
+    namespace = {'_cls': cls, '_generic_hash': generic_hash}
+    values = ''.join(f', {get_attribute("self", name)}'
+                     for name, _, _, copy_value in cls.__input_fields__ if copy_value is None)
+    lines = [
+        'def __hash__(self):',
+        '    if type(self) is not _cls:',
+        '        return _generic_hash(self)',
+        f'    return hash((_cls{values}))',
+    ]
+    return _finalize(compile_function('__hash__', lines, namespace), cls, generic_hash)
+
+
+def generate_copy(cls: Type[Model], generic_copy: Callable[[Model, bool], Model]) -> Callable[[Model, bool], Model]:
+    """Generates copying of all input fields with direct attribute access, non-atomic fields are copied if deep."""
+    namespace = {'_cls': cls, '_generic_copy': generic_copy}
+    shallow, deep = [], []
+    for index, (name, _, _, copy_value) in enumerate(cls.__input_fields__):
+        value = get_attribute('self', name)
+        shallow.append(f'        {set_attribute("copied", name, value)}')
+        if copy_value is None:
+            deep.append(f'        {set_attribute("copied", name, value)}')
+        else:
+            namespace[f'_copy_value_{index}'] = copy_value
+            deep.append(f'        {set_attribute("copied", name, f"_copy_value_{index}({value})")}')
+    lines = [
+        'def copy(self, deep=False):',
+        '    if type(self) is not _cls:',
+        '        return _generic_copy(self, deep)',
+        '    copied = _cls.__new__(_cls)',
+    ]
+    if shallow:
+        lines.extend(['    if deep:', *deep, '    else:', *shallow])
+    lines.append('    return copied')
+    return _finalize(compile_function('copy', lines, namespace), cls, generic_copy)
+
+
+def generate_to_primitive(cls: Type[Model], fields: Tuple[_OutputFieldConfig, ...],
+                          generic_to_primitive: Callable) -> Callable[[Model, Role, Any], dict]:
+    """Generates serialization of the given output fields, options of each field are resolved while generating."""
+    from stereotype.fields.model import ModelField
+    namespace = {'_Missing': Missing}
+    body = []
+    # Leading items that are always present are built by a single dict display, the rest is added conditionally
+    initial_items = []
+    for index, (field, name, serializable, to_primitive, to_primitive_name, hide_none, hide_empty, empty_value) \
+            in enumerate(fields):
+        key = _constant(to_primitive_name, f'_key_{index}', namespace)
+        if serializable is not None:
+            namespace[f'_serializable_{index}'] = serializable
+            if not hide_none and len(initial_items) == index:
+                initial_items.append(f'{key}: _serializable_{index}(self)')
+            elif hide_none:
+                body.extend([
+                    f'    value = _serializable_{index}(self)',
+                    '    if value is not None:',
+                    f'        result[{key}] = value',
+                ])
+            else:
+                body.append(f'    result[{key}] = _serializable_{index}(self)')
+            continue
+
+        body.append(f'    value = {get_attribute("self", name)}')
+        # Any field can be explicitly set to Missing, which hides it from the output
+        body.append('    if value is not _Missing:')
+        indent = '        '
+        if to_primitive is not None and type(field).to_primitive is ModelField.to_primitive:
+            # Nested models are serialized directly, the role is passed through unchanged
+            body.extend([
+                f'{indent}if value is not None:',
+                f'{indent}    value = value.to_primitive(role, context)',
+            ])
+        elif to_primitive is not None:
+            namespace[f'_to_primitive_{index}'] = to_primitive
+            body.append(f'{indent}value = _to_primitive_{index}(value, role, context)')
+        condition = _output_condition(field, index, hide_none, hide_empty, empty_value, namespace)
+        if condition is not None:
+            body.extend([
+                f'{indent}if {condition}:',
+                f'{indent}    result[{key}] = value',
+            ])
+        else:
+            body.append(f'{indent}result[{key}] = value')
+    lines = [
+        'def to_primitive(self, role, context):',
+        f'    result = {{{", ".join(initial_items)}}}',
+        *body,
+        '    return result',
+    ]
+    return _finalize(compile_function('to_primitive', lines, namespace), cls, generic_to_primitive)
+
+
+def _output_condition(field: Field, index: int, hide_none: bool, hide_empty: bool, empty_value: Any,
+                      namespace: Dict[str, Any]) -> Optional[str]:
+    """Condition for including a field's value in output, or None if it's always included."""
+    if hide_empty and type(empty_value) in _FALSY_EMPTY_TYPES and not empty_value \
+            and type(field).to_primitive in _standard_to_primitives():
+        # For values of the empty value's type (or None), equality with it is the same as being falsy,
+        # custom to_primitive implementations may output values of other types though
+        return 'value' if hide_none else 'value is None or value'
+    conditions = []
+    if hide_none:
+        conditions.append('value is not None')
+    if hide_empty:
+        namespace[f'_empty_{index}'] = empty_value
+        conditions.append(f'not value == _empty_{index}')
+    return ' and '.join(conditions) or None
+
+
+def generate_validation_errors(cls: Type[Model], validated_fields: List[Field],
+                               generic_validation_errors: Callable) -> Callable[[Model, Any], Iterable[PathErrorType]]:
+    """
+    Generates validation of the given fields, matching __validated_fields__. Unless a Field overrides
+    `validation_errors`, its required and None checks are inlined, so no generator is created for the Field.
+    """
+    namespace = {'_Missing': Missing}
+    lines = [
+        'def validation_errors(self, context):',
+        *_validation_body(cls, validated_fields, namespace, 'yield {}, {}'),
+        '    return',
+        '    yield  # Makes this a generator function even with nothing to validate',
+    ]
+    return _finalize(compile_function('validation_errors', lines, namespace), cls, generic_validation_errors)
+
+
+def generate_collect_validation_errors(cls: Type[Model], validated_fields: List[Field],
+                                       generic_validation_errors: Callable) -> Callable[[Model, list, Any], None]:
+    """Same as `generate_validation_errors`, but errors are appended to a list, avoiding resuming a generator."""
+    namespace = {'_Missing': Missing}
+    lines = [
+        'def collect_validation_errors(self, errors, context):',
+        '    append = errors.append',
+        *_validation_body(cls, validated_fields, namespace, 'append(({}, {}))', collect=True),
+    ]
+    return _finalize(compile_function('collect_validation_errors', lines, namespace), cls, generic_validation_errors)
+
+
+def _validation_body(cls: Type[Model], validated_fields: List[Field], namespace: Dict[str, Any],
+                     report: str, collect: bool = False) -> List[str]:
+    """
+    The report format string receives the path and error expressions and makes them a statement.
+    If collecting, the generated code has the list of errors in a local variable `errors`.
+    """
+    lines = []
+    for index, (field, (name, input_name, allow_none, validation_errors, validator_method)) \
+            in enumerate(zip(validated_fields, cls.__validated_fields__)):
+        path = _constant((input_name,), f'_path_{index}', namespace)
+        inlined = type(field).validation_errors is Field.validation_errors
+        # Checks of a value that is present, and not None unless allowed
+        checks = []
+        if inlined and field.native_validate is not None:
+            indent = '            ' if allow_none else '        '
+            if allow_none:
+                checks.append('        if value is not None:')
+            if collect and type(field).validate in _nested_model_validators():
+                # Nested models collect their errors directly into the list too, paths are prefixed afterwards
+                checks.extend([
+                    f'{indent}collect = value.__collect_validation_errors__',
+                    f'{indent}if collect is None:',
+                    f'{indent}    for path, error in value.validation_errors(context):',
+                    f'{indent}        {report.format(f"{path} + path", "error")}',
+                    f'{indent}else:',
+                    f'{indent}    start = len(errors)',
+                    f'{indent}    collect(errors, context)',
+                    f'{indent}    for position in range(start, len(errors)):',
+                    f'{indent}        path, error = errors[position]',
+                    f'{indent}        errors[position] = {path} + path, error',
+                ])
+            else:
+                namespace[f'_native_validate_{index}'] = field.native_validate
+                checks.extend([
+                    f'{indent}for path, error in _native_validate_{index}(value, context):',
+                    f'{indent}    {report.format(f"{path} + path", "error")}',
+                ])
+        validators = (field.validators or ()) if inlined else ()
+        for validator_index, validator in enumerate(validators):
+            namespace[f'_validator_{index}_{validator_index}'] = validator
+            checks.extend([
+                '        try:',
+                f'            _validator_{index}_{validator_index}(value, context)',
+                '        except ValueError as e:',
+                f'            {report.format(path, "str(e)")}',
+            ])
+        if validator_method is not None:
+            namespace[f'_validator_method_{index}'] = validator_method
+            checks.extend([
+                '        try:',
+                f'            _validator_method_{index}(self, value, context)',
+                '        except ValueError as e:',
+                f'            {report.format(path, "str(e)")}',
+            ])
+
+        lines.append(f'    value = {get_attribute("self", name)}')
+        if inlined:
+            lines.extend([
+                f'    if value is _Missing{"" if allow_none else " or value is None"}:',
+                f"        {report.format(path, repr('This field is required'))}",
+            ])
+            if checks:
+                lines.append('    else:')
+        else:
+            namespace[f'_validation_errors_{index}'] = validation_errors
+            lines.extend([
+                f'    for path, error in _validation_errors_{index}(value, context):',
+                f'        {report.format(f"{path} + path", "error")}',
+            ])
+            if checks:
+                lines.append(f'    if value is not _Missing{"" if allow_none else " and value is not None"}:')
+        lines.extend(checks)
+    return lines
+
+
+def _standard_converters() -> Tuple[Callable, ...]:
+    from stereotype.fields.atomic import BoolField, IntField
+    from stereotype.fields.base import AnyField
+    from stereotype.fields.compound import ListField, DictField
+    from stereotype.fields.model import ModelField, DynamicModelField
+    return (Field.convert, AnyField.convert, BoolField.convert, IntField.convert, ListField.convert, DictField.convert,
+            ModelField.convert, DynamicModelField.convert)
+
+
+def _standard_to_primitives() -> Tuple[Callable, ...]:
+    from stereotype.fields.compound import ListField, DictField
+    return Field.to_primitive, ListField.to_primitive, DictField.to_primitive
+
+
+def _nested_model_validators() -> Tuple[Callable, ...]:
+    from stereotype.fields.model import ModelField, DynamicModelField
+    return ModelField.validate, DynamicModelField.validate
+
+
+def _finalize(function: Callable, cls: Type[Model], generic: Callable) -> Callable:
+    function.__qualname__ = f'{cls.__qualname__}.{function.__name__}'
+    function.__module__ = cls.__module__
+    function.__doc__ = generic.__doc__
+    function.__stereotype_generated__ = True
+    return function
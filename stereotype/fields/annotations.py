@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import types
+from functools import lru_cache
 from typing import Any, Optional, TYPE_CHECKING, Union, get_origin, get_args
 
 from stereotype.utils import ConfigurationError
@@ -73,7 +74,7 @@ class AnnotationResolver:
         elif atomic_field := ATOMIC_TYPE_MAPPING.get(self.annotation):
             return atomic_field()
 
-        elif issubclass(self.annotation, Model):
+        elif isinstance(self.annotation, type) and issubclass(self.annotation, Model):
             return ModelField()
 
         raise ConfigurationError(f'Unrecognized field annotation {self!r} (may need an explicit Field)')
@@ -88,3 +89,16 @@ class AnnotationResolver:
         except ConfigurationError:
             pass
         return ConfigurationError(f'{type(field).__name__} cannot be used for annotation {self!r}{hint}')
+
+
+def resolve_field(annotation: Any, explicit_field: Optional[Field] = None) -> Field:
+    """Resolve the annotation to a new Field, copying a cached template if the annotation was auto-resolved before."""
+    if explicit_field is not None and explicit_field is not NotImplemented:
+        return AnnotationResolver(annotation).resolve(explict_field=explicit_field)
+    return _auto_resolved_template(id(annotation), annotation).copy_field()
+
+
+@lru_cache(maxsize=1024)
+def _auto_resolved_template(_: int, annotation: Any) -> Field:
+    # Keyed by identity as well, since equal annotations may resolve differently, e.g. the order of Union options
+    return AnnotationResolver(annotation).resolve()
@@ -109,12 +109,17 @@ class IntField(_BaseNumberField):
         self._set_min_max_value_validation(min_value, max_value)
 
     def convert(self, value: Any) -> Any:
+        if type(value) is int:
+            return value
         if value is Missing:
             return self._fill_missing()
         if value is None:
             return None
-        if isinstance(value, float) and value != int(value):
-            raise TypeError(f'Numeric value {value} is not an integer')
+        if isinstance(value, float):
+            converted = int(value)
+            if converted != value:
+                raise TypeError(f'Numeric value {value} is not an integer')
+            return converted
         try:
             return int(value)
         except (ValueError, TypeError):
@@ -186,6 +191,8 @@ class StrField(_AtomicField):
         self.regex = re.compile(regex) if isinstance(regex, str) else regex
         if self.choices is not None:
             self.native_validate = self._validate_choices
+        elif min_length > 0 and min_length == max_length:
+            self.native_validate = self._validate_exact_length
         elif min_length > 0 and max_length is not None:
             self.native_validate = self._validate_min_max_length
         elif min_length == 1:
@@ -198,15 +205,18 @@ class StrField(_AtomicField):
             self.native_validate = self._validate_regex
 
     def _validate_choices(self, value: str, _: ValidationContextType) -> Iterable[PathErrorType]:
-        if value not in self.choices:
-            yield (), f'Must be one of: {", ".join(self.choices)}'
+        # Not a generator, almost all values are valid choices and this avoids creating one per value
+        if value in self.choices:
+            return ()
+        return ((), f'Must be one of: {", ".join(self.choices)}'),
+
+    def _validate_exact_length(self, value: str, _: ValidationContextType) -> Iterable[PathErrorType]:
+        if len(value) != self.min_length:
+            yield (), f'Must be exactly {self.min_length} character{"s" if self.min_length > 1 else ""} long'
 
     def _validate_min_max_length(self, value: str, _: ValidationContextType) -> Iterable[PathErrorType]:
         if not (self.min_length <= len(value) <= self.max_length):
-            if self.min_length == self.max_length:
-                yield (), f'Must be exactly {self.min_length} character{"s" if self.min_length > 1 else ""} long'
-            else:
-                yield (), f'Must be {self.min_length} to {self.max_length} characters long'
+            yield (), f'Must be {self.min_length} to {self.max_length} characters long'
 
     # Note: the validation methods that are put in place of native_validate may not be static
     # noinspection PyMethodMayBeStatic
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import sys
 from copy import deepcopy, copy
-from typing import Any, Optional, Callable, Iterable, TYPE_CHECKING, List, Tuple
+from functools import lru_cache
+from typing import Any, Optional, Callable, Iterable, TYPE_CHECKING, List, Tuple, Type
 
 from stereotype.fields.annotations import AnnotationResolver
 from stereotype.roles import DEFAULT_ROLE, Role
@@ -17,6 +19,36 @@ def field_method_overriden(obj, method_name) -> bool:
     return getattr(type(obj), method_name) is not getattr(Field, method_name)
 
 
+@lru_cache(maxsize=None)
+def _field_copier(cls: Type[Field]) -> Callable[[Field], Field]:
+    """Generates a shallow copy of instances of a Field class, assigning its slots and __dict__ directly."""
+    from stereotype.codegen import compile_function, get_attribute, set_attribute
+    if hasattr(cls, '__copy__'):
+        return copy
+    slots = {}
+    has_dict = False
+    for klass in cls.__mro__[:-1]:
+        if '__slots__' not in klass.__dict__:
+            has_dict = True
+            continue
+        names = klass.__slots__
+        for name in (names,) if isinstance(names, str) else names:
+            if name == '__dict__':
+                has_dict = True
+            elif name != '__weakref__':  # Weak references aren't copied, like with `copy.copy`
+                if name.startswith('__') and not name.endswith('__'):
+                    name = f'_{klass.__name__.lstrip("_")}{name}'  # Private names are mangled
+                slots[name] = None
+    lines = [
+        'def copy_field(self):',
+        '    copied = _new(_cls)',
+        *[f'    {set_attribute("copied", name, get_attribute("self", name))}' for name in slots],
+        *(['    copied.__dict__.update(self.__dict__)'] if has_dict else []),
+        '    return copied',
+    ]
+    return compile_function('copy_field', lines, {'_new': object.__new__, '_cls': cls})
+
+
 class Field:
     """
     Abstract base class for other field types. Use :class:`AnyField` if type shouldn't be checked.
@@ -73,8 +105,13 @@ class Field:
         self.name = name
         if self.primitive_name is Missing:
             self.primitive_name = name
+        elif type(self.primitive_name) is str:
+            # Used as keys of input and output dicts, interned ones are compared by identity (subclasses can't be)
+            self.primitive_name = sys.intern(self.primitive_name)
         if self.to_primitive_name is Missing:
             self.to_primitive_name = name
+        elif type(self.to_primitive_name) is str:
+            self.to_primitive_name = sys.intern(self.to_primitive_name)
 
     def init_default(self, default: Any):
         self.required = False
@@ -98,7 +135,10 @@ class Field:
         Copies the field definition - explicit Fields must be copied, otherwise subclasses would share them.
         Any fields where plain `copy.copy` won't be enough should be manually adjusted afterwards.
         """
-        copied = copy(self)
+        try:
+            copied = _field_copier(type(self))(self)
+        except AttributeError:  # Some slot isn't set, copy handles that
+            copied = copy(self)
         # The native_validate slot contains a method, which would normally remain bound to the old instance
         native_validate = getattr(self, 'native_validate', None)
         if native_validate is not None:
@@ -168,11 +208,37 @@ class Field:
         )
 
 
+_IMMUTABLE_PRIMITIVES = (str, int, float, bool, type(None))
+
+
+def _copy_primitive(value: Any, memo: dict) -> Any:
+    value_type = type(value)
+    if value_type in _IMMUTABLE_PRIMITIVES:
+        return value
+    if id(value) in memo:
+        return memo[id(value)]  # Shared and self-referencing values stay shared in the copy
+    if value_type is list:
+        copied = memo[id(value)] = []
+        copied.extend(_copy_primitive(item, memo) for item in value)
+    elif value_type is dict:
+        copied = memo[id(value)] = {}
+        for key, item in value.items():
+            copied[key] = _copy_primitive(item, memo)
+    else:
+        return deepcopy(value, memo)
+    return copied
+
+
+def _deep_copy(value: Any) -> Any:
+    """Like `copy.deepcopy`, but plain lists and dicts are copied without its dispatch overhead."""
+    return _copy_primitive(value, {})
+
+
 class AnyField(Field):
     """
     Value of any type (usually annotation ``typing.Any``, but can be anything).
 
-    :param deep_copy: If true, conversion, serialization and copying will use copy.deepcopy for this value
+    :param deep_copy: If true, conversion, serialization and copying will deep copy this value
     :param default: Means the field isn't required, used as default directly or called if callable
     :param hide_none: If the field's value is None, it will be hidden from serialized output
     :param primitive_name: Changes the key used to represent the field in serialized data - input or output
@@ -198,10 +264,10 @@ class AnyField(Field):
     def convert(self, value: Any) -> Any:
         if value is Missing:
             return self._fill_missing()
-        return deepcopy(value) if self.deep_copy else value
+        return _deep_copy(value) if self.deep_copy else value
 
     def copy_value(self, value: Any) -> Any:
-        return deepcopy(value)
+        return _deep_copy(value)
 
     def to_primitive(self, value: Any, role: Role = DEFAULT_ROLE, context: ToPrimitiveContextType = None) -> Any:
-        return deepcopy(value) if self.deep_copy else value
+        return _deep_copy(value) if self.deep_copy else value
@@ -1,25 +1,89 @@
 from __future__ import annotations
 
-from typing import Any, Optional, Iterable, get_args, List
+from typing import Any, Optional, Iterable, get_args, List, Callable
 
-from stereotype.fields.annotations import AnnotationResolver
+from stereotype.fields.annotations import AnnotationResolver, resolve_field
+from stereotype.fields.atomic import BoolField, IntField
 from stereotype.fields.base import Field, ValidationContextType
 from stereotype.roles import Role, DEFAULT_ROLE
 from stereotype.utils import Missing, ConfigurationError, ConversionError, PathErrorType, Validator, \
     ToPrimitiveContextType
 
 
+_REQUIRED_ERRORS = (((), 'This field is required'),)
+_ATOMIC_TYPES = (bool, int, float, str)
+_ATOMIC_CONVERTERS = (Field.convert, BoolField.convert, IntField.convert)
+
+
+def _required_validation(value: Any, _: ValidationContextType) -> Iterable[PathErrorType]:
+    return _REQUIRED_ERRORS if value is Missing or value is None else ()
+
+
+def _required_allow_none_validation(value: Any, _: ValidationContextType) -> Iterable[PathErrorType]:
+    return _REQUIRED_ERRORS if value is Missing else ()
+
+
+def _unconverted_type(field: Field) -> Optional[type]:
+    """Built-in conversions of atomic fields return values of exactly the field's type unchanged, or None."""
+    if field.type in _ATOMIC_TYPES and type(field).convert in _ATOMIC_CONVERTERS:
+        return field.type
+    return None
+
+
+def _is_model_field(field: Field) -> bool:
+    """Whether values of the field serialize with their own to_primitive, so a compound field can call it directly."""
+    from stereotype.fields.model import ModelField
+    return type(field).to_primitive is ModelField.to_primitive
+
+
+def _model_validation(value: Any, context: ValidationContextType) -> Iterable[PathErrorType]:
+    if value is Missing or value is None:
+        return _REQUIRED_ERRORS
+    return _collect_model_errors(value, context)
+
+
+def _model_allow_none_validation(value: Any, context: ValidationContextType) -> Iterable[PathErrorType]:
+    if value is None:
+        return ()
+    if value is Missing:
+        return _REQUIRED_ERRORS
+    return _collect_model_errors(value, context)
+
+
+def _collect_model_errors(model: Any, context: ValidationContextType) -> List[PathErrorType]:
+    collect = model.__collect_validation_errors__
+    if collect is None:
+        return list(model.validation_errors(context))
+    errors = []
+    collect(errors, context)
+    return errors
+
+
+def _item_validator(field: Field) -> Callable[[Any, ValidationContextType], Iterable[PathErrorType]]:
+    """Validation of items, a plain function instead of generators if only the required check or a model applies."""
+    if type(field).validation_errors is Field.validation_errors and field.validators is None:
+        if field.native_validate is None:
+            return _required_allow_none_validation if field.allow_none else _required_validation
+        from stereotype.fields.model import ModelField, DynamicModelField
+        if type(field).validate in (ModelField.validate, DynamicModelField.validate):
+            # Models collect their errors into a list, instead of one generator per model and its field
+            return _model_allow_none_validation if field.allow_none else _model_validation
+    return field.validation_errors
+
+
 class _CompoundField(Field):
-    __slots__ = Field.__slots__ + ('min_length', 'max_length')
+    __slots__ = Field.__slots__ + ('min_length', 'max_length', 'copy_output')
     atomic = False
 
     def __init__(self, *, default: Any = Missing, hide_none: bool = False, hide_empty: bool = False,
                  primitive_name: Optional[str] = Missing, to_primitive_name: Optional[str] = Missing,
-                 min_length: int = 0, max_length: Optional[int] = None, validators: Optional[List[Validator]] = None):
+                 min_length: int = 0, max_length: Optional[int] = None, validators: Optional[List[Validator]] = None,
+                 copy_output: bool = True):
         super().__init__(default=default, hide_none=hide_none, hide_empty=hide_empty,
                          primitive_name=primitive_name, to_primitive_name=to_primitive_name, validators=validators)
         self.min_length = min_length
         self.max_length = max_length
+        self.copy_output = copy_output
 
     def init_from_annotation(self, parser: AnnotationResolver):
         raise NotImplementedError  # pragma: no cover
@@ -51,27 +115,31 @@ class ListField(_CompoundField):
     :param min_length: Validation enforces the list has a minimum number of items (1 => non-empty)
     :param max_length: Validation enforces the list has a maximum number of items
     :param validators: Optional list of validator callbacks - they raise ``ValueError`` if the value is invalid
+    :param copy_output: If false and items need no serialization, the list itself is output, so it must not be modified
     """
 
-    __slots__ = _CompoundField.__slots__ + ('item_field',)
+    __slots__ = _CompoundField.__slots__ + ('item_field', 'model_items')
     type = list
     empty_value = []
 
     def __init__(self, item_field: Field = NotImplemented, *,
                  default: Any = Missing, hide_none: bool = False, hide_empty: bool = False,
                  primitive_name: Optional[str] = Missing, to_primitive_name: Optional[str] = Missing,
-                 min_length: int = 0, max_length: Optional[int] = None, validators: Optional[List[Validator]] = None):
+                 min_length: int = 0, max_length: Optional[int] = None, validators: Optional[List[Validator]] = None,
+                 copy_output: bool = True):
         super().__init__(default=default, hide_none=hide_none, hide_empty=hide_empty,
                          primitive_name=primitive_name, to_primitive_name=to_primitive_name,
-                         min_length=min_length, max_length=max_length, validators=validators)
+                         min_length=min_length, max_length=max_length, validators=validators, copy_output=copy_output)
         self.item_field: Field = item_field
+        self.model_items: bool = False
         self.native_validate = self.validate
 
     def init_from_annotation(self, parser: AnnotationResolver):
         if parser.origin is not list:
             raise parser.incorrect_type(self)
         item_annotation, = get_args(parser.annotation)
-        self.item_field = AnnotationResolver(item_annotation).resolve(self.item_field)
+        self.item_field = resolve_field(item_annotation, self.item_field)
+        self.model_items = _is_model_field(self.item_field)
 
     def init_default(self, default: Any):
         if default == self.empty_value:
@@ -79,8 +147,9 @@ class ListField(_CompoundField):
         super().init_default(default)
 
     def validate(self, value: Any, context: ValidationContextType) -> Iterable[PathErrorType]:
-        yield from super().validate(value, context)
-        item_validator = self.item_field.validation_errors
+        if self.min_length > 0 or self.max_length is not None:  # Usually unbounded, skipping a nested generator
+            yield from super().validate(value, context)
+        item_validator = _item_validator(self.item_field)
         for index, item in enumerate(value):
             for path, error in item_validator(item, context):
                 yield (str(index),) + path, error
@@ -91,13 +160,20 @@ class ListField(_CompoundField):
         if value is None:
             return None
         converter = self.item_field.convert
+        item_type = _unconverted_type(self.item_field)
+        if item_type is not None and type(value) is list:
+            # Items are mostly of the right type already, only convert the rest
+            try:
+                return [item if type(item) is item_type else converter(item) for item in value]
+            except (TypeError, ValueError):
+                pass  # Converted again below to find the failing item
         converted = []
         error_index = 0
         try:
             for error_index, item in enumerate(value):
                 converted.append(converter(item))
         except ConversionError as e:
-            raise e.wrapped(str(error_index))
+            raise e.prepend_path(str(error_index))
         except (TypeError, ValueError) as e:
             raise ConversionError.new(str(e), str(error_index))
         return converted
@@ -114,7 +190,10 @@ class ListField(_CompoundField):
         if value is None or value is Missing:
             return value
         if not self.item_field.custom_to_primitive:
-            return list(value)
+            return list(value) if self.copy_output else value
+        if self.model_items:
+            # Models are serialized directly, avoiding a call of ModelField.to_primitive per item
+            return [item if item is None or item is Missing else item.to_primitive(role, context) for item in value]
         item_to_primitive = self.item_field.to_primitive
         return [item_to_primitive(item, role, context) for item in value]
 
@@ -137,31 +216,35 @@ class DictField(_CompoundField):
     :param min_length: Validation enforces the dict has a minimum number of items (1 => non-empty)
     :param max_length: Validation enforces the dict has a maximum number of items
     :param validators: Optional list of validator callbacks - they raise ``ValueError`` if the value is invalid
+    :param copy_output: If false and values need no serialization, the dict itself is output, so it must not be modified
     """
 
-    __slots__ = _CompoundField.__slots__ + ('key_field', 'value_field')
+    __slots__ = _CompoundField.__slots__ + ('key_field', 'value_field', 'model_values')
     type = dict
     empty_value = {}
 
     def __init__(self, key_field: Field = NotImplemented, value_field: Field = NotImplemented, *,
                  default: Any = Missing, hide_none: bool = False, hide_empty: bool = False,
                  primitive_name: Optional[str] = Missing, to_primitive_name: Optional[str] = Missing,
-                 min_length: int = 0, max_length: Optional[int] = None, validators: Optional[List[Validator]] = None):
+                 min_length: int = 0, max_length: Optional[int] = None, validators: Optional[List[Validator]] = None,
+                 copy_output: bool = True):
         super().__init__(default=default, hide_none=hide_none, hide_empty=hide_empty,
                          primitive_name=primitive_name, to_primitive_name=to_primitive_name,
-                         min_length=min_length, max_length=max_length, validators=validators)
+                         min_length=min_length, max_length=max_length, validators=validators, copy_output=copy_output)
         self.key_field: Field = key_field
         self.value_field: Field = value_field
+        self.model_values: bool = False
         self.native_validate = self.validate
 
     def init_from_annotation(self, parser: AnnotationResolver):
         if parser.origin is not dict:
             raise parser.incorrect_type(self)
         key_annotation, value_annotation = get_args(parser.annotation)
-        self.key_field = AnnotationResolver(key_annotation).resolve(self.key_field)
+        self.key_field = resolve_field(key_annotation, self.key_field)
         if not self.key_field.atomic:
             raise ConfigurationError(f'DictField keys may only be booleans, numbers or strings: {parser!r}')
-        self.value_field = AnnotationResolver(value_annotation).resolve(self.value_field)
+        self.value_field = resolve_field(value_annotation, self.value_field)
+        self.model_values = _is_model_field(self.value_field)
 
     def init_default(self, default: Any):
         if default == self.empty_value:
@@ -169,9 +252,10 @@ class DictField(_CompoundField):
         super().init_default(default)
 
     def validate(self, value: Any, context: ValidationContextType) -> Iterable[PathErrorType]:
-        yield from super().validate(value, context)
-        key_validator = self.key_field.validation_errors
-        value_validator = self.value_field.validation_errors
+        if self.min_length > 0 or self.max_length is not None:  # Usually unbounded, skipping a nested generator
+            yield from super().validate(value, context)
+        key_validator = _item_validator(self.key_field)
+        value_validator = _item_validator(self.value_field)
 
         for key, val in value.items():
             for path, error in key_validator(key, context):
@@ -190,9 +274,14 @@ class DictField(_CompoundField):
         value_converter = self.value_field.convert
         error_key = Missing  # An error cannot occur before the first assignment to this, so Missing won't be used
         try:
+            key_type = _unconverted_type(self.key_field)
+            if key_type is not None:
+                # Keys recur across many dicts and are mostly of the right type already, only convert the rest
+                return {(key if type(error_key := key) is key_type else key_converter(key)): value_converter(val)
+                        for key, val in value.items()}
             return {key_converter(error_key := key): value_converter(val) for key, val in value.items()}
         except ConversionError as e:
-            raise e.wrapped(str(error_key))
+            raise e.prepend_path(str(error_key))
         except (TypeError, ValueError) as e:
             raise ConversionError.new(str(e), str(error_key))
 
@@ -208,7 +297,11 @@ class DictField(_CompoundField):
         if value is None or value is Missing:
             return value
         if not self.value_field.custom_to_primitive:
-            return dict(value)
+            return dict(value) if self.copy_output else value
+        if self.model_values:
+            # Models are serialized directly, avoiding a call of ModelField.to_primitive per value
+            return {key: val if val is None or val is Missing else val.to_primitive(role, context)
+                    for key, val in value.items()}
         item_to_primitive = self.value_field.to_primitive
         return {key: item_to_primitive(val, role, context) for key, val in value.items()}
 
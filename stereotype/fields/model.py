@@ -34,7 +34,7 @@ class ModelField(Field):
         self.type: Type[Model] = cast(Type[Model], NotImplemented)
 
     def init_from_annotation(self, parser: AnnotationResolver):
-        if not issubclass(parser.annotation, Model):
+        if not (isinstance(parser.annotation, type) and issubclass(parser.annotation, Model)):
             raise parser.incorrect_type(self)
         self.type = parser.annotation
 
@@ -42,6 +42,12 @@ class ModelField(Field):
         yield from value.validation_errors(context)
 
     def convert(self, value: Any) -> Any:
+        # Exact types of the common input values are checked first, avoiding isinstance checks
+        value_type = type(value)
+        if value_type is dict:
+            return self.type(value)
+        if value_type is self.type:
+            return value
         if value is Missing:
             if self.required:
                 return Missing
@@ -98,7 +104,7 @@ class DynamicModelField(Field):
             raise parser.incorrect_type(self)
         options = get_args(parser.annotation)
 
-        if not all(issubclass(option, Model) for option in options):
+        if not all(isinstance(option, type) and issubclass(option, Model) for option in options):
             raise ConfigurationError(f'Union Model fields can only be Optional or Union of Model subclass types, '
                                      f'got {parser!r}')
 
@@ -125,15 +131,16 @@ class DynamicModelField(Field):
         yield from value.validation_errors(context)
 
     def convert(self, value: Any) -> Any:
-        if value is Missing:
-            if self.required:
-                return Missing
-            return self.default if self.default_factory is None else self.default_factory()
-        is_model = isinstance(value, Model)
-        if is_model and not isinstance(value, self.types):
-            raise TypeError(f'Expected {self.type_repr}, got {type(value).__name__}')
-        if is_model or value is None:
-            return value
+        if type(value) is not dict:  # Plain dict input is the common case, needing none of these checks
+            if value is Missing:
+                if self.required:
+                    return Missing
+                return self.default if self.default_factory is None else self.default_factory()
+            is_model = isinstance(value, Model)
+            if is_model and not isinstance(value, self.types):
+                raise TypeError(f'Expected {self.type_repr}, got {type(value).__name__}')
+            if is_model or value is None:
+                return value
 
         try:
             value_type = value['type']
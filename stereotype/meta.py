@@ -1,17 +1,25 @@
 from __future__ import annotations
 
+import sys
+from itertools import chain
+from operator import attrgetter
 from typing import Dict, Any, Iterable, Tuple, get_type_hints, cast, List, Set, Type, TYPE_CHECKING, Optional, \
     get_origin, ClassVar
 
-from stereotype.fields.annotations import AnnotationResolver
+from stereotype.codegen import generate_init, generate_eq, generate_hash, generate_copy, generate_to_primitive, \
+    generate_validation_errors, generate_collect_validation_errors, is_generated
+from stereotype.fields.annotations import resolve_field
 from stereotype.fields.base import Field
 from stereotype.fields.serializable import SerializableField
-from stereotype.roles import Role, RequestedRoleFields, FinalizedRoleFields, _AbstractMemberDescriptor
+from stereotype.roles import Role, RequestedRoleFields, FinalizedRoleFields, _AbstractMemberDescriptor, _roles
 from stereotype.utils import ConfigurationError, Missing
 
 if TYPE_CHECKING:  # pragma: no cover
     from stereotype.model import Model
 
+_CLASS_VAR_PREFIXES = ('ClassVar[', 'typing.ClassVar[')
+_field_name = attrgetter('name')
+
 
 class ModelMeta(type):
     def __new__(mcs, name: str, bases: Tuple[type, ...], attrs: Dict[str, Any]):
@@ -19,24 +27,28 @@ class ModelMeta(type):
             return type.__new__(mcs, name, bases, attrs)
 
         # Only annotated attributes iterated here for the purposes of slots, not serializable fields
-        field_names = list(mcs._iterate_own_fields(attrs.get('__annotations__', {})))
-        mcs._check_explicit_field_annotations(name, set(field_names), attrs)
+        # Interned, as field names are used as keys and attribute names by all hot paths (dynamic classes may not be)
+        field_names = [sys.intern(name) for name in mcs._iterate_own_fields(attrs.get('__annotations__', {}))]
         field_values = {}
         for field_name in field_names:
             if field_name in attrs:
                 # Field attributes popped as they will become instance attributes instead of class attributes
                 field_values[field_name] = attrs.pop(field_name)
+        mcs._check_explicit_field_annotations(name, attrs)
 
         # Find serializable, keep them in `attrs` as they need to remain as properties
         serializable_names = {name for name, _ in mcs._iterate_serializable(attrs)}
         own_field_names = set(field_names) | serializable_names
 
+        # Models (and Model itself) are exactly the instances of this metaclass among the bases
+        model_bases = [base for base in bases if isinstance(base, ModelMeta)]
+        base_slots = chain.from_iterable(getattr(base, '__abstract_slots__', ()) for base in model_bases)
+
         # Using dicts instead of sets to preserve order
-        attrs['__abstract_slots__'] = all_slots = [slot for slot in {
-            **{slot: 0 for slot in mcs._iterate_base_fields(bases)},
-            **{slot: 1 for slot in field_names},
-            **{slot: 2 for slot in attrs.get('__slots__', ())},
-        } if slot not in serializable_names]
+        attrs['__abstract_slots__'] = all_slots = [
+            slot for slot in dict.fromkeys(chain(base_slots, field_names, attrs.get('__slots__', ())))
+            if slot not in serializable_names
+        ]
 
         if attrs.get('__abstract__', False):
             attrs.pop('__slots__', None)
@@ -47,10 +59,19 @@ class ModelMeta(type):
 
         attrs['__fields__'] = NotImplemented
         attrs['__input_fields__'] = NotImplemented
+        attrs['__input_names__'] = NotImplemented
         attrs['__validated_fields__'] = NotImplemented
+        attrs['__validate_fields__'] = NotImplemented
+        attrs['__collect_validation_errors__'] = NotImplemented
         attrs['__role_fields__'] = NotImplemented
+        attrs['__to_primitive_by_role__'] = NotImplemented
         attrs['__roles__'] = NotImplemented
-        attrs['__gettable__'] = set(all_slots) | set(mcs._iterate_base_gettable(bases)) | mcs._find_properties(attrs)
+        attrs['__repr_fields__'] = NotImplemented
+        attrs['__fields_by_role__'] = {}
+        attrs['__field_names_by_role__'] = {}
+        attrs['__initialize_args__'] = (bases, own_field_names, field_values)
+        attrs['__gettable__'] = frozenset().union(all_slots, mcs._find_properties(attrs),
+                                                  *(getattr(base, '__gettable__', ()) for base in model_bases))
 
         try:
             cls = cast(Type['Model'], type.__new__(mcs, name, bases, attrs))
@@ -58,7 +79,6 @@ class ModelMeta(type):
             raise ConfigurationError(f'{name}: {e}, if inheriting from multiple models, only one may have __slots__ '
                                      f'(declare abstract models without __slots__ by adding class attribute '
                                      f'`__abstract__ = True`)')
-        cls.__initialize_model__ = lambda *_: mcs._initialize_model(cls, bases, own_field_names, field_values)
         return cls
 
     @classmethod
@@ -69,25 +89,17 @@ class ModelMeta(type):
             # Skip attributes with ClassVar annotations - they shouldn't become fields
             if isinstance(annotation, str):
                 # Delayed annotation; it's not a good time to resolve type hints properly, work with it as a string
-                class_var_prefix = annotation.startswith('ClassVar[') or annotation.startswith('typing.ClassVar[')
-                if class_var_prefix and annotation.endswith(']'):
+                if annotation.startswith(_CLASS_VAR_PREFIXES) and annotation.endswith(']'):
                     continue
             elif get_origin(annotation) is ClassVar:
                 continue
             yield name
 
     @classmethod
-    def _iterate_base_fields(mcs, bases: Tuple[type, ...]) -> Iterable[str]:
-        from stereotype.model import Model
-        for base in bases:
-            if not issubclass(base, Model):
-                continue
-            yield from getattr(base, '__abstract_slots__', ())
-
-    @classmethod
-    def _check_explicit_field_annotations(mcs, cls_name: str, field_names: Set[str], attrs: Dict[str, Any]):
+    def _check_explicit_field_annotations(mcs, cls_name: str, attrs: Dict[str, Any]):
+        # Called after popping field values from attrs, so any remaining Field is not a field
         for name, value in attrs.items():
-            if isinstance(value, Field) and name not in field_names:
+            if isinstance(value, Field):
                 raise ConfigurationError(f"Field {name} of Model class {cls_name} defines an explicit Field "
                                          f"but lacks a type annotation or isn't public")
 
@@ -99,13 +111,52 @@ class ModelMeta(type):
         mcs._ensure_parent_models(model_bases, own_field_names, field_values)
 
         serializable = list(mcs._analyze_serializable(cls))
-        serializable_names = {field.name for field in serializable}
+        serializable_names = set(map(_field_name, serializable))
         input_fields = [field for field in mcs._analyze_fields(cls, field_values)
                         if field.name not in serializable_names]
-        cls.__input_fields__ = [field.make_input_config() for field in input_fields]
-        cls.__validated_fields__ = [field.make_validated_config() for field in input_fields if field.has_validation()]
-        cls.__fields__ = input_fields + serializable
+        # Tuples, as these never change after initialization
+        cls.__input_fields__ = tuple([field.make_input_config() for field in input_fields])
+        cls.__input_names__ = tuple([name for name, _, _, _ in cls.__input_fields__])
+        validated_fields = [field for field in input_fields if field.has_validation()]
+        cls.__validated_fields__ = tuple([field.make_validated_config() for field in validated_fields])
+        cls.__validate_fields__ = generate_validation_errors(cls, validated_fields, Model.validation_errors)
+        # Used by validate, unless validation_errors is overridden and has to be called instead
+        cls.__collect_validation_errors__ = None
+        if mcs._inherited_method_replaceable(cls, 'validation_errors', Model):
+            cls.__collect_validation_errors__ = generate_collect_validation_errors(
+                cls, validated_fields, Model.validation_errors)
+        cls.__fields__ = (*input_fields, *serializable)
+        cls.__repr_fields__ = tuple([(field.name, mcs._repr_kind(field, Model)) for field in input_fields])
         mcs._build_roles(cls, model_bases, own_field_names)
+        # Roles with the same output fields (like all roles without any declared for this model) share one function
+        to_primitive_by_fields = {}
+        for fields in cls.__role_fields__:
+            if id(fields) not in to_primitive_by_fields:
+                to_primitive_by_fields[id(fields)] = generate_to_primitive(cls, fields, Model.to_primitive)
+        cls.__to_primitive_by_role__ = tuple([to_primitive_by_fields[id(fields)] for fields in cls.__role_fields__])
+        if mcs._inherited_method_replaceable(cls, '__init__', Model):
+            cls.__init__ = generate_init(cls, input_fields, Model.__init__)
+        if mcs._inherited_method_replaceable(cls, '__eq__', Model):
+            cls.__eq__ = generate_eq(cls, Model.__eq__)
+        if mcs._inherited_method_replaceable(cls, '__hash__', Model):
+            cls.__hash__ = generate_hash(cls, Model.__hash__)
+        if mcs._inherited_method_replaceable(cls, 'copy', Model):
+            cls.copy = generate_copy(cls, Model.copy)
+
+    @staticmethod
+    def _repr_kind(field: Field, model_cls: Type[Model]) -> Optional[type]:
+        """Resolved once, so that repr doesn't need to check the type of each field."""
+        if field.type is list or field.type is dict:
+            return field.type
+        if isinstance(field.type, type) and issubclass(field.type, model_cls):  # Custom fields may use any type
+            return model_cls
+        return None
+
+    @staticmethod
+    def _inherited_method_replaceable(cls: Type[Model], name: str, model_cls: Type[Model]) -> bool:
+        """Generated methods may only replace the generic Model implementation, not ones defined by users."""
+        method = next(klass.__dict__[name] for klass in cls.__mro__ if name in klass.__dict__)
+        return method is getattr(model_cls, name) or is_generated(method)
 
     @classmethod
     def _ensure_parent_models(mcs, model_bases: List[Type[Model]], own_field_names: Set[str], field_values: dict):
@@ -117,36 +168,49 @@ class ModelMeta(type):
                     field_values[field.name] = field
 
     @classmethod
-    def _analyze_fields(mcs, cls: Type[Model], field_values: dict) -> Iterable[Field]:
+    def _analyze_fields(mcs, cls: Type[Model], field_values: dict) -> List[Field]:
         all_field_names = set(getattr(cls, '__abstract_slots__', ()))
-        for name, annotation in mcs._resolve_annotations(cls).items():
-            if name not in all_field_names:
-                continue
+        validator_methods = mcs._collect_validator_methods(cls)
+        annotations = mcs._resolve_annotations(cls)
+        fields: List[Field] = []
+        # A single exception handler serves all fields, the name of the failing one is still known when handling
+        try:
+            for name, annotation in annotations.items():
+                if name not in all_field_names:
+                    continue
+
+                explicit_field: Optional[Field] = None
+                default = Missing
+                if name in field_values:
+                    value = field_values[name]
+                    if isinstance(value, Field):
+                        explicit_field = value
+                    else:
+                        default = value
 
-            explicit_field: Optional[Field] = None
-            default = Missing
-            if name in field_values:
-                value = field_values[name]
-                if isinstance(value, Field):
-                    explicit_field = value
-                else:
-                    default = value
-
-            try:
-                field = AnnotationResolver(annotation).resolve(explict_field=explicit_field)
+                field = resolve_field(annotation, explicit_field)
                 field.init_name(name)
                 if default is not Missing:
                     field.init_default(default)
                 # Note a default could have also been present in the explicit field
                 field.check_default()
-            except ConfigurationError as e:
-                raise ConfigurationError(f"Field {name} of {cls.__name__}: {e}")
 
-            validator_method = getattr(cls, f'validate_{name}', None)
-            if validator_method is not None:
-                field.validator_method = validator_method
+                validator_method = validator_methods.get(name)
+                if validator_method is not None:
+                    field.validator_method = validator_method
 
-            yield field
+                fields.append(field)
+        except ConfigurationError as e:
+            raise ConfigurationError(f"Field {name} of {cls.__name__}: {e}")
+        return fields
+
+    @staticmethod
+    def _collect_validator_methods(cls: Type[Model]) -> Dict[str, Any]:
+        """Maps field names to validate_* methods, scanning class dicts once instead of a lookup per field."""
+        prefix = 'validate_'
+        names = {name for klass in cls.__mro__ for name in klass.__dict__ if name.startswith(prefix)}
+        # Only names known to exist are resolved via getattr, which keeps the semantics of any descriptors
+        return {name[len(prefix):]: getattr(cls, name) for name in names}
 
     @classmethod
     def _iterate_serializable(mcs, attrs: Dict[str, Any]) -> Iterable[Tuple[str, SerializableField]]:
@@ -159,8 +223,12 @@ class ModelMeta(type):
 
     @classmethod
     def _analyze_serializable(mcs, cls: Type[Model]):
-        attrs = {name: getattr(cls, name) for name in dir(cls)}
-        for name, field in mcs._iterate_serializable(attrs):
+        # Walking class dicts directly is much cheaper than `dir` + `getattr`, which invokes every descriptor
+        attrs = {}
+        for klass in reversed(cls.__mro__):
+            attrs.update(klass.__dict__)  # Attributes of subclasses shadow those of their bases
+        # Sorted by name, like `dir` returns them, which determines the order in serialized output
+        for name, field in sorted(mcs._iterate_serializable(attrs), key=lambda item: item[0]):
             field.init_name(name)
             yield field
 
@@ -169,14 +237,6 @@ class ModelMeta(type):
         """Enumerates properties and serializable fields (as they are also properties) of the model class."""
         return {name for name, attr in attrs.items() if isinstance(attr, property)}
 
-    @classmethod
-    def _iterate_base_gettable(mcs, bases: Tuple[type, ...]) -> Iterable[str]:
-        from stereotype.model import Model
-        for base in bases:
-            if not issubclass(base, Model):
-                continue
-            yield from getattr(base, '__gettable__', ())
-
     @staticmethod
     def _resolve_annotations(cls: Type[Model]) -> Dict[str, Any]:
         extra_types: Set[Type[Model]] = cls.resolve_extra_types()
@@ -190,20 +250,18 @@ class ModelMeta(type):
     @classmethod
     def _build_roles(mcs, cls: Type[Model], bases: List[Type[Model]], own_field_names: Set[str]):
         roles = mcs._collect_finalized_roles(cls, bases, own_field_names)
-        max_role_code = max((role.code for role in roles.keys()), default=0)
-        default_role_fields = [
-            field.make_output_config() for field in cls.__fields__ if field.to_primitive_name is not None
-        ]
-        cls.__role_fields__ = [default_role_fields] * (max_role_code + 1)
-        cls.__roles__ = []
-
+        # Output configs are immutable, so each is created once and shared by all the roles including the field
+        output_configs = {
+            field.name: field.make_output_config() for field in cls.__fields__ if field.to_primitive_name is not None
+        }
+        all_fields = tuple(output_configs.values())
+        # Dense by role code for all roles created so far, those not configured for this model include all or no fields
+        role_fields = [() if role.empty_by_default else all_fields for role in list(_roles)]
         for role, finalized in roles.items():
-            field_configs = [
-                field.make_output_config() for field in cls.__fields__
-                if field.name in finalized.fields and field.to_primitive_name is not None
-            ]
-            cls.__role_fields__[role.code] = field_configs
-            cls.__roles__.append(finalized)
+            role_fields[role.code] = tuple([config for name, config in output_configs.items()
+                                            if name in finalized.fields])
+        cls.__role_fields__ = tuple(role_fields)
+        cls.__roles__ = tuple(roles.values())
 
     @classmethod
     def _collect_finalized_roles(mcs, cls: Type[Model], bases: List[Type[Model]], own_field_names: Set[str],
@@ -211,15 +269,20 @@ class ModelMeta(type):
         all_field_names, own_requested_roles = mcs._collect_own_requested_roles(cls)
         all_roles = {finalized.role for base in bases for finalized in base.__roles__} | set(own_requested_roles.keys())
         roles: Dict[Role, FinalizedRoleFields] = {role: FinalizedRoleFields(role) for role in all_roles}
+        # Only these roles include all fields of bases that don't declare them
+        inclusive_roles = [(role, finalized) for role, finalized in roles.items() if not role.empty_by_default]
 
         for base in reversed(bases):
-            base_roles: Dict[Role, FinalizedRoleFields] = {finalized.role: finalized for finalized in base.__roles__}
-            for role, finalized in roles.items():
-                base_finalized = base_roles.get(role)
-                if base_finalized is not None:
-                    finalized.fields.update(base_finalized.fields)
-                elif not role.empty_by_default:
-                    finalized.fields.update(field.name for field in base.__fields__)
+            # Every role of a base is also in `roles`, so each base role can be merged directly
+            base_roles: Set[Role] = set()
+            for base_finalized in base.__roles__:
+                roles[base_finalized.role].fields.update(base_finalized.fields)
+                base_roles.add(base_finalized.role)
+            # Materialized once per base, updating sets from another set is a bulk operation
+            base_field_names = frozenset(map(_field_name, base.__fields__))
+            for role, finalized in inclusive_roles:
+                if role not in base_roles:
+                    finalized.fields.update(base_field_names)
 
         for role, finalized in roles.items():
             own_requested = own_requested_roles.get(role)
@@ -232,7 +295,7 @@ class ModelMeta(type):
 
     @classmethod
     def _collect_own_requested_roles(mcs, cls: Type[Model]) -> Tuple[Set[str], Dict[Role, RequestedRoleFields]]:
-        all_field_names = {field.name for field in cls.__fields__}
+        all_field_names = set(map(_field_name, cls.__fields__))
         own_requested_roles: Dict[Role, RequestedRoleFields] = {}
         for requested in cls.declare_roles():
             if requested.role in own_requested_roles:
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Optional, Tuple, List, Iterable, Type, Set, Any, Callable
+from typing import Optional, Tuple, List, Iterable, Type, Set, Any, Callable, FrozenSet, Dict
 
 from stereotype.fields.base import Field
 from stereotype.meta import ModelMeta
@@ -23,12 +23,21 @@ class Model(metaclass=ModelMeta):
 
     __slots__ = []
     # Don't use these fields in external code directly, they may not be initialized!
-    __fields__: List[Field]
-    __input_fields__: List[_InputFieldConfig]
-    __validated_fields__: List[_ValidatedFieldConfig]
-    __role_fields__: List[List[_OutputFieldConfig]]
-    __roles__: List[FinalizedRoleFields]
-    __gettable__: Set[str]
+    __fields__: Tuple[Field, ...]
+    __input_fields__: Tuple[_InputFieldConfig, ...]
+    __input_names__: Tuple[str, ...]  # The name column of __input_fields__, for methods that only need names
+    __validated_fields__: Tuple[_ValidatedFieldConfig, ...]
+    __validate_fields__: Callable[[Model, ValidationContextType], Iterable[PathErrorType]]
+    __collect_validation_errors__: Optional[Callable[[Model, list, ValidationContextType], None]]
+    __role_fields__: Tuple[Tuple[_OutputFieldConfig, ...], ...]
+    __to_primitive_by_role__: Tuple[Callable[[Model, Role, Any], dict], ...]
+    __roles__: Tuple[FinalizedRoleFields, ...]
+    __repr_fields__: Tuple[Tuple[str, Optional[type]], ...]  # Names of non-serializable fields & list, dict or Model
+    __gettable__: FrozenSet[str]
+    # Caches of fields_for_role and field_names_for_role, by role code
+    __fields_by_role__: Dict[int, Tuple[Field, ...]]
+    __field_names_by_role__: Dict[int, Tuple[str, ...]]
+    __initialize_args__: Tuple[Tuple[type, ...], Set[str], dict]
 
     def __init__(self, raw_data: Optional[dict] = None):
         """
@@ -39,20 +48,22 @@ class Model(metaclass=ModelMeta):
         """
         if self.__input_fields__ is NotImplemented:
             self.__initialize_model__()
-        if raw_data is None:
-            raw_data = {}
-        elif not isinstance(raw_data, dict):
-            raise ConversionError.new(f'Supplied type {type(raw_data).__name__}, needs a mapping')
+        if type(raw_data) is not dict:  # Exact dicts are the common case, skipping both checks
+            if raw_data is None:
+                raw_data = {}
+            elif not isinstance(raw_data, dict):
+                raise ConversionError.new(f'Supplied type {type(raw_data).__name__}, needs a mapping')
 
+        get = raw_data.get
         for name, primitive_name, convert, copy_value in self.__input_fields__:
             if primitive_name is None:
                 value = Missing
             else:
-                value = raw_data.get(primitive_name, Missing)
+                value = get(primitive_name, Missing)
             try:
                 setattr(self, name, convert(value))
             except ConversionError as e:
-                raise e.wrapped(primitive_name)
+                raise e.prepend_path(primitive_name)
             except (TypeError, ValueError) as e:
                 raise ConversionError.new(str(e), primitive_name)
 
@@ -63,29 +74,14 @@ class Model(metaclass=ModelMeta):
         :param role: Can be used together with declare_roles to exclude fields for certain roles.
         :param context: Optional value opaque to stereotype, useful for serializing custom field types.
         """
-        if role.code < len(self.__role_fields__):
-            fields = self.__role_fields__[role.code]
-        elif role.empty_by_default:
-            return {}
-        else:
-            fields = self.__role_fields__[0]
-
-        result = {}
-        for _, name, serializable, to_primitive, to_primitive_name, hide_none, hide_empty, empty_value in fields:
-            if serializable is None:
-                value = getattr(self, name)
-                if value is Missing:
-                    continue
-                converted = to_primitive(value, role, context) if to_primitive is not None else value
-                if (converted is None and hide_none) or (hide_empty and converted == empty_value):
-                    continue
-                result[to_primitive_name] = converted
-            else:
-                value = serializable(self)
-                if value is None and hide_none:
-                    continue
-                result[to_primitive_name] = value
-        return result
+        try:
+            to_primitive = self.__to_primitive_by_role__[role.code]
+        except IndexError:
+            # Only roles created after this model was initialized are missing, they can't be configured for it
+            if role.empty_by_default:
+                return {}
+            to_primitive = self.__to_primitive_by_role__[0]
+        return to_primitive(self, role, context)
 
     serialize = to_primitive
 
@@ -99,7 +95,12 @@ class Model(metaclass=ModelMeta):
 
         :param context: Optional value opaque to stereotype, passed to any custom validation methods (validate_*).
         """
-        errors = list(self.validation_errors(context))
+        collect_validation_errors = self.__collect_validation_errors__
+        if collect_validation_errors is None:
+            errors = list(self.validation_errors(context))
+        else:
+            errors = []
+            collect_validation_errors(errors, context)
         if errors:
             raise ValidationError(errors)
 
@@ -112,15 +113,12 @@ class Model(metaclass=ModelMeta):
 
         :param context: Optional value opaque to stereotype, passed to Field validators and validate_* Model methods.
         """
-        for name, input_name, allow_none, validation_errors, validator_method in self.__validated_fields__:
-            value = getattr(self, name)
-            for path, error in validation_errors(value, context):
-                yield (input_name,) + path, error
-            if validator_method is not None and value is not Missing and (value is not None or allow_none):
-                try:
-                    validator_method(self, value, context)
-                except ValueError as e:
-                    yield (input_name,), str(e)
+        return self.__validate_fields__(context)
+
+    @classmethod
+    def __initialize_model__(cls):
+        # Models are initialized lazily, when first used, so that they may reference models declared later
+        type(cls)._initialize_model(cls, *cls.__initialize_args__)
 
     @classmethod
     def declare_roles(cls) -> Iterable[RequestedRoleFields]:
@@ -163,37 +161,35 @@ class Model(metaclass=ModelMeta):
         return value if value is not Missing else default
 
     def __eq__(self, other: Model):
-        if type(self) != type(other):
+        if type(self) is not type(other):
             return False
-        for name, primitive_name, convert, copy_value in self.__input_fields__:
+        for name in self.__input_names__:
             if getattr(self, name) != getattr(other, name):
                 return False
         return True
 
+    def __hash__(self):
+        # Only atomic fields are hashed, they are hashable and equal for equal models, unlike other fields
+        atomic_values = [getattr(self, name) for name, _, _, copy_value in self.__input_fields__ if copy_value is None]
+        return hash((type(self), *atomic_values))
+
     def __repr__(self):
         parts = []
-        for field in self.__fields__:
-            base = f'{field.name}='
-            if field.serializable is not None:
-                continue
-            value = getattr(self, field.name)
-            if field.type is list or field.type is dict:
-                if value:
-                    if field.type is list:
-                        parts.append(f'{base}[({len(value)} items)]')
-                    else:
-                        parts.append(f'{base}{{({len(value)} items)}}')
-                else:
-                    parts.append(f'{base}{value!r}')
-            elif field.type is not NotImplemented and issubclass(field.type, Model):
-                parts.append(f'{base}{type(value).__name__ if isinstance(value, Model) else value}')
+        for name, kind in self.__repr_fields__:
+            value = getattr(self, name)
+            if kind is list and value:
+                parts.append(f'{name}=[({len(value)} items)]')
+            elif kind is dict and value:
+                parts.append(f'{name}={{({len(value)} items)}}')
+            elif kind is Model:
+                parts.append(f'{name}={type(value).__name__ if isinstance(value, Model) else value}')
             else:
-                parts.append(f'{base}{repr(value)}')
+                parts.append(f'{name}={value!r}')
         return f'<{self.__class__.__name__} {{' + ', '.join(parts) + '}>'
 
     def items(self) -> Iterable[Tuple[str, Any]]:
         """Provides an iterator over the fields of this model, with field name and converted value pairs."""
-        for name, primitive_name, convert, copy_value in self.__input_fields__:
+        for name in self.__input_names__:
             value = getattr(self, name)
             if value is Missing:
                 continue  # Missing required fields are skipped intentionally
@@ -202,9 +198,13 @@ class Model(metaclass=ModelMeta):
     def copy(self, deep: bool = False) -> Model:
         """Creates an optionally deep copy of this model."""
         copied = self.__new__(self.__class__)
+        if not deep:
+            for name in self.__input_names__:
+                setattr(copied, name, getattr(self, name))
+            return copied
         for name, primitive_name, convert, copy_value in self.__input_fields__:
             value = getattr(self, name)
-            if deep and copy_value is not None:
+            if copy_value is not None:
                 value = copy_value(value)
             setattr(copied, name, value)
         return copied
@@ -216,12 +216,17 @@ class Model(metaclass=ModelMeta):
 
         :param role: The :class:`Role` that controls which fields are present
         """
-        if cls.__role_fields__ is NotImplemented:
-            cls.__initialize_model__()
-        if role.code < len(cls.__role_fields__):
-            return [field for field, _, _, _, _, _, _, _ in cls.__role_fields__[role.code]]
-        else:
-            return [] if role.empty_by_default else list(cls.__fields__)
+        fields = cls.__fields_by_role__.get(role.code)
+        if fields is None:
+            if cls.__role_fields__ is NotImplemented:
+                cls.__initialize_model__()
+            if role.code < len(cls.__role_fields__):
+                role_fields = cls.__role_fields__[role.code]
+            else:
+                role_fields = () if role.empty_by_default else cls.__role_fields__[0]
+            fields = tuple([field for field, _, _, _, _, _, _, _ in role_fields])
+            cls.__fields_by_role__[role.code] = fields
+        return list(fields)  # A new list, so that callers may modify it without affecting the cache
 
     @classmethod
     def field_names_for_role(cls, role: Role = DEFAULT_ROLE) -> List[str]:
@@ -230,7 +235,11 @@ class Model(metaclass=ModelMeta):
 
         :param role: The :class:`Role` that controls which fields are present
         """
-        return [field.to_primitive_name for field in cls.fields_for_role(role)]
+        names = cls.__field_names_by_role__.get(role.code)
+        if names is None:
+            names = tuple([field.to_primitive_name for field in cls.fields_for_role(role)])
+            cls.__field_names_by_role__[role.code] = names
+        return list(names)
 
 
 _NativeValidator = Callable[[Any, ValidationContextType], Iterable[PathErrorType]]
@@ -68,14 +68,18 @@ class FinalizedRoleFields:
 
     def update_requested(self, other: RequestedRoleFields, all_field_names: Set[str], field_names: Set[str]):
         assert self.role == other.role
-        if other.override_parents:
-            initial = set() if other.is_whitelist else all_field_names
-        else:
-            initial = self.fields
+        # The fields set is owned by this instance, so it's updated in place where possible
         if other.is_whitelist:
-            self.fields = initial | other.fields
+            if other.override_parents:
+                self.fields = set(other.fields)
+            else:
+                self.fields |= other.fields
         else:
-            self.fields = (initial | field_names) - other.fields
+            if other.override_parents:
+                self.fields = all_field_names | field_names
+            else:
+                self.fields |= field_names
+            self.fields -= other.fields
 
 
 class RequestedRoleFields:
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from functools import cached_property
 from typing import Union, List, Dict, Tuple, cast, Any, Callable
 
 
@@ -55,6 +56,8 @@ class DataError(StereotypeError):
     error_list: List[PathErrorType]
 
     ERRORS_DICT_SELF_KEY = '_global'
+    # Set on copies created by prepend_path, which aren't visible to anyone else and can be modified in place
+    _owns_path = False
 
     def __init__(self, errors: List[PathErrorType]):
         self.error_list = errors
@@ -67,13 +70,14 @@ class DataError(StereotypeError):
             return f'{": ".join(path)}: {error}'
         assert self.error_list, 'Cannot create the exception without any errors'
 
-    @property
+    @cached_property
     def errors(self) -> Dict[str, Union[List[str], dict]]:
         """
         Generates a potentially deeply nested dictionary with errors and their paths.
 
         Keys in the dictionaries are field (primitive) names.
         Values are either lists of error messages from simple fields, or recursive dictionaries for compound fields.
+        The dictionary is generated on first access and then cached, the `error_list` shall not change afterwards.
         """
         errors = {}
         for path, error in self.error_list:
@@ -99,6 +103,21 @@ class DataError(StereotypeError):
     def wrapped(self, *path: str) -> DataError:
         raise type(self)([(path + original_path, error) for original_path, error in self.error_list])
 
+    def prepend_path(self, *path: str) -> DataError:
+        """
+        Returns the exception with the path prepended to all errors, cheaper than `wrapped` while re-raising.
+        The exception is only modified in place if it was created by an earlier call, others are copied first.
+        """
+        error_list = [(path + original_path, error) for original_path, error in self.error_list]
+        if not self._owns_path:
+            copied = type(self)(error_list)
+            copied._owns_path = True
+            return copied
+        self.error_list = error_list
+        self.args = (self._error_string(),)
+        self.__dict__.pop('errors', None)  # Regenerated on next access
+        return self
+
 
 class ConversionError(DataError, TypeError):
     """Single error created when converting raw data to a Model, caused mostly by failed type coercions."""
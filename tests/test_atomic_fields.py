@@ -1,11 +1,12 @@
 from __future__ import annotations
 
 import re
+from enum import Enum
 from typing import Optional
 from unittest import TestCase
 
 from stereotype import Model, Missing, ValidationError, ConversionError, BoolField, IntField, ConfigurationError, \
-    FloatField, StrField
+    FloatField, StrField, DEFAULT_ROLE
 from tests.common import PrivateStrField
 
 
@@ -62,6 +63,22 @@ class TestBooleanField(TestCase):
 
         self.assertEqual('<Field plain of type bool, default=<False>>', repr(BoolSpecialModel.__fields__[0]))
 
+    def test_str_enum_names(self):
+        class Key(str, Enum):
+            flag = 'flag'
+            out = 'out'
+
+        class EnumNames(Model):
+            value: bool = BoolField(primitive_name=Key.flag, to_primitive_name=Key.out)
+
+        model = EnumNames({'flag': True})
+        self.assertIs(True, model.value)
+        self.assertEqual({'out': True}, model.serialize())
+        model.value = None
+        with self.assertRaises(ValidationError) as ctx:
+            model.validate()
+        self.assertEqual({'flag': ['This field is required']}, ctx.exception.errors)
+
     def test_bad_values(self):
         model = BoolModel({'req': None, 'opt': 'No', 'opt_def': 'true'})
         self.assertIs(None, model.req)
@@ -155,6 +172,9 @@ class TestIntField(TestCase):
         with self.assertRaises(ConversionError) as ctx:
             IntModel({'max': '1.5'})
         self.assertEqual({'max': ["Value '1.5' is not an integer number"]}, ctx.exception.errors)
+        model = IntModel({'min': 4.0, 'max': True})
+        self.assertIs(int, type(model.min))
+        self.assertEqual((4, 1), (model.min, model.max))
 
     def test_none_and_defaults(self):
         model = IntModel({'min': 4, 'max': None})
@@ -350,6 +370,19 @@ class TestStrField(TestCase):
 
         self.assertEqual('<Field non_empty of type Optional[str], required>', repr(StrModel.__fields__[1]))
 
+    def test_str_enum_choices(self):
+        class Size(str, Enum):
+            small = 'small'
+            large = 'large'
+
+        class Shirt(Model):
+            size: str = StrField(choices=Size)
+
+        Shirt({'size': 'large'}).validate()
+        with self.assertRaises(ValidationError) as ctx:
+            Shirt({'size': 'medium'}).validate()
+        self.assertEqual({'size': ['Must be one of: small, large']}, ctx.exception.errors)
+
     def test_bad_validation_combo(self):
         with self.assertRaises(ConfigurationError) as ctx:
             class LengthChoices(Model):
@@ -369,6 +402,16 @@ class TestStrField(TestCase):
         self.assertEqual({'empty': None}, Hidden({'none': None, 'empty': None}).serialize())
         self.assertEqual({'none': ''}, Hidden({'none': '', 'empty': ''}).serialize())
 
+        class ZeroStrField(StrField):
+            def to_primitive(self, value, role=DEFAULT_ROLE, context=None):
+                return 0 if value == '' else value
+
+        class CustomOutput(Model):
+            s: str = ZeroStrField(hide_empty=True)
+
+        # Only values equal to the empty value are hidden, custom output of a different type isn't
+        self.assertEqual({'s': 0}, CustomOutput({'s': ''}).serialize())
+
 
 class TestFieldCommon(TestCase):
     def test_validators(self):
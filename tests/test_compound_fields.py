@@ -136,6 +136,43 @@ class TestListType(TestCase):
             },
         }, ctx.exception.errors)
 
+    def test_optional_items(self):
+        class OptionalItems(Model):
+            values: List[Optional[int]]
+
+        model = OptionalItems({'values': [None, 1]})
+        model.validate()
+        model.values = [None, Missing]
+        with self.assertRaises(ValidationError) as ctx:
+            model.validate()
+        self.assertEqual({'values': {'1': ['This field is required']}}, ctx.exception.errors)
+
+    def test_optional_model_items(self):
+        class OptionalModels(Model):
+            models: List[Optional[MyStrModel]]
+
+        model = OptionalModels({'models': [None, {'field': 'x'}]})
+        self.assertEqual({'models': [None, {'field': 'x'}]}, model.to_primitive())
+        model.validate()
+        model.models.extend([Missing, MyStrModel({'field': 'long'})])
+        with self.assertRaises(ValidationError) as ctx:
+            model.validate()
+        self.assertEqual({'models': {
+            '2': ['This field is required'],
+            '3': {'field': ['Must be at most 3 characters long']},
+        }}, ctx.exception.errors)
+
+    def test_output_without_copy(self):
+        class Shared(Model):
+            copied: List[int] = list
+            shared: List[int] = ListField(copy_output=False, default=list)
+
+        model = Shared({'copied': [1], 'shared': [2]})
+        primitive = model.to_primitive()
+        self.assertEqual({'copied': [1], 'shared': [2]}, primitive)
+        self.assertIsNot(model.copied, primitive['copied'])
+        self.assertIs(model.shared, primitive['shared'])
+
     def test_size_validation(self):
         class Sizes(Model):
             min: List[int] = ListField(default=[], min_length=1)
@@ -190,6 +227,11 @@ class TestListType(TestCase):
             Collections({'ints': ['bad', 'worse']})
         self.assertEqual({'ints': {'0': ["Value 'bad' is not an integer number"]}}, ctx.exception.errors)
 
+        with self.assertRaises(ConversionError) as ctx:
+            Collections({'ints': [1, '2', 3.5]})
+        self.assertEqual({'ints': {'2': ['Numeric value 3.5 is not an integer']}}, ctx.exception.errors)
+        self.assertEqual([1, 2, 3], Collections({'ints': (1, '2', 3.0)}).ints)
+
     def test_configuration_error_not_list(self):
         class Bad(Model):
             mismatch: Dict[str, MyStrModel] = ListField(item_field=ModelField())
@@ -446,6 +488,34 @@ class TestDictType(TestCase):
             RequiredDict({'dict': {None: None}}).validate()
         self.assertEqual('dict: None: This field is required', str(ctx.exception))
 
+    def test_key_conversion(self):
+        class Keys(Model):
+            ints: Dict[int, int]
+            strs: Dict[str, int]
+
+        model = Keys({'ints': {True: 3, '2': 2}, 'strs': {'a': 1, 2: 2}})
+        self.assertEqual({1: 3, 2: 2}, model.ints)
+        self.assertEqual([int, int], [type(key) for key in model.ints])
+        self.assertEqual({'a': 1, '2': 2}, model.strs)
+
+    def test_output_without_copy(self):
+        class Shared(Model):
+            copied: Dict[str, int] = dict
+            shared: Dict[str, int] = DictField(copy_output=False, default=dict)
+
+        model = Shared({'copied': {'a': 1}, 'shared': {'b': 2}})
+        primitive = model.to_primitive()
+        self.assertEqual({'copied': {'a': 1}, 'shared': {'b': 2}}, primitive)
+        self.assertIsNot(model.copied, primitive['copied'])
+        self.assertIs(model.shared, primitive['shared'])
+
+    def test_optional_model_values(self):
+        class OptionalModels(Model):
+            models: Dict[str, Optional[MyStrModel]]
+
+        model = OptionalModels({'models': {'none': None, 'model': {'field': 'x'}}})
+        self.assertEqual({'models': {'none': None, 'model': {'field': 'x'}}}, model.to_primitive())
+
     def test_configuration_error_not_dict(self):
         class Bad(Model):
             mismatch: List[MyStrModel] = DictField(key_field=BoolField(), value_field=ModelField())
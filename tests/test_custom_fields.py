@@ -1,7 +1,8 @@
-from typing import Any, Optional
+from typing import Any, Optional, Iterable
 from unittest import TestCase
 
-from stereotype import StrField, Missing, Role, DEFAULT_ROLE, Model
+from stereotype import StrField, Missing, Role, DEFAULT_ROLE, Model, ValidationError
+from stereotype.utils import PathErrorType, ValidationContextType
 
 
 class PrefixStrField(StrField):
@@ -27,6 +28,19 @@ class PrefixStrField(StrField):
         return self.prefix + primitive
 
 
+class LenientStrField(StrField):
+    """Overrides the validation of required values entirely, reporting them with a custom message."""
+
+    def validation_errors(self, value: Any, context: ValidationContextType) -> Iterable[PathErrorType]:
+        if value is Missing:
+            yield (), 'Please fill this in'
+
+
+class DashStrField(StrField):
+    """A dash represents an empty value, for example to be hidden by `hide_empty`."""
+    empty_value = '-'
+
+
 class TestCustomFields(TestCase):
     def test_prefix_str_field(self):
         class MyModel(Model):
@@ -47,3 +61,35 @@ class TestCustomFields(TestCase):
         model = MyModel({})
         self.assertIs(Missing, model.a_prefix)
         self.assertEqual({}, model.to_primitive())
+
+    def test_overridden_validation_errors(self):
+        class MyModel(Model):
+            lenient: str = LenientStrField(min_length=5)
+            optional: Optional[str] = LenientStrField()
+
+            def validate_lenient(self, value: str, _):
+                if value == 'bad':
+                    raise ValueError('Bad value')
+
+        with self.assertRaises(ValidationError) as ctx:
+            MyModel().validate()
+        self.assertEqual({'lenient': ['Please fill this in'], 'optional': ['Please fill this in']},
+                         ctx.exception.errors)
+
+        # Neither None nor native validation (min_length) is checked by the custom implementation
+        MyModel({'lenient': None, 'optional': None}).validate()
+        MyModel({'lenient': 'abc', 'optional': 'abc'}).validate()
+
+        with self.assertRaises(ValidationError) as ctx:
+            MyModel({'lenient': 'bad', 'optional': None}).validate()
+        self.assertEqual({'lenient': ['Bad value']}, ctx.exception.errors)
+
+    def test_custom_empty_value(self):
+        class MyModel(Model):
+            dash: Optional[str] = DashStrField(hide_empty=True, default='-')
+            dash_hide_none: Optional[str] = DashStrField(hide_empty=True, hide_none=True, default=None)
+
+        self.assertEqual({}, MyModel().to_primitive())
+        self.assertEqual({'dash': ''}, MyModel({'dash': '', 'dash_hide_none': '-'}).to_primitive())
+        model = MyModel({'dash': None, 'dash_hide_none': ''})
+        self.assertEqual({'dash': None, 'dash_hide_none': ''}, model.to_primitive())
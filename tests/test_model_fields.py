@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Optional, Union, Type, Set
+from typing import Optional, Union, Type, Set, List
 from unittest import TestCase
 
 from stereotype import Model, Missing, ValidationError, ConversionError, ModelField, DynamicModelField, \
@@ -116,6 +116,39 @@ class TestModelType(TestCase):
             {'depth': 2, 'trunk': {'left': '<hidden>', 'right': '<hidden>'}}
         )
 
+    def test_nested_errors(self):
+        class Strict(Leaf):
+            def validation_errors(self, context=None):
+                yield from super().validation_errors(context)
+                if self.color != 'green':
+                    yield ('color',), 'Only green leaves are allowed'
+
+        class Holder(Model):
+            first: Optional[Branch] = None
+            second: Optional[Strict] = None
+            third: Trunk = Trunk
+            fourth: List[Strict] = list
+
+            @classmethod
+            def resolve_extra_types(cls) -> Set[Type[Model]]:
+                return {Strict}
+
+        model = Holder({'first': {'sub-branch': {'leaf': {'color': None}}}, 'second': {'color': 'red'},
+                        'third': {'right': {'type': 'branch', 'leaf': {'color': 'red'}, 'sub-branch': {}}},
+                        'fourth': [{'color': 'green'}, {'color': 'red'}]})
+        with self.assertRaises(ValidationError) as ctx:
+            model.validate()
+        self.assertEqual({
+            'first': {'leaf': ['This field is required'],
+                      'sub-branch': {'leaf': {'color': ['This field is required']}}},
+            'second': {'color': ['Only green leaves are allowed']},
+            'third': {'right': {'sub-branch': {'leaf': ['This field is required']}}},
+            'fourth': {'1': {'color': ['Only green leaves are allowed']}},
+        }, ctx.exception.errors)
+        self.assertEqual(ctx.exception.errors, ValidationError(list(model.validation_errors())).errors)
+
+        Holder({'third': {}}).validate()
+
 
 class TestDynamicModelField(TestCase):
     def test_empty(self):
@@ -159,6 +192,15 @@ class TestDynamicModelField(TestCase):
         self.assertEqual("Field field of Bad: Union Model fields can only be Optional or Union of Model subclass types,"
                          " got typing.Union[tests.common.Leaf, tests.test_model_fields.Fake]", str(ctx.exception))
 
+    def test_bad_configuration_non_class(self):
+        class Bad(Model):
+            field: Union[Leaf, List[int]]
+
+        with self.assertRaises(ConfigurationError) as ctx:
+            Bad()
+        self.assertEqual("Field field of Bad: Union Model fields can only be Optional or Union of Model subclass types,"
+                         " got typing.Union[tests.common.Leaf, typing.List[int]]", str(ctx.exception))
+
     def test_bad_configuration_no_type(self):
         class Worse(Model):
             field: Union[Leaf, Trunk, None]
@@ -1,13 +1,14 @@
 from __future__ import annotations
 
 from copy import copy, deepcopy
-from typing import Set, cast, Any, Optional, List, Dict, Union, Type, ClassVar
+from typing import Set, cast, Any, Optional, List, Dict, Union, Type, ClassVar, Iterable, NewType
 from unittest import TestCase
 
 from stereotype import Model, Missing, ValidationError, ConversionError, BoolField, IntField, ConfigurationError, \
     FloatField, StrField, DataError, serializable
 from stereotype.fields.base import Field, AnyField
-from stereotype.fields.compound import DictField
+from stereotype.fields.compound import DictField, ListField
+from stereotype.utils import PathErrorType
 from tests.common import Leaf
 
 
@@ -60,6 +61,7 @@ class TestModels(TestCase):
             DriedLeaf(cast(dict, 'bad'))
         self.assertEqual('Supplied type str, needs a mapping', str(ctx.exception))
         self.assertEqual({'_global': ['Supplied type str, needs a mapping']}, ctx.exception.errors)
+        self.assertIs(ctx.exception.errors, ctx.exception.errors)
 
     def test_initialized_baseclass(self):
         Leaf()  # Ensures it is pre-initialized
@@ -122,6 +124,80 @@ class TestModels(TestCase):
         other = AnotherChild({'a': 0, 'b': 0, 'c': 1})
         other.validate()
 
+    def test_custom_init(self):
+        class Custom(Model):
+            value: int
+            total: int = 0
+
+            def __init__(self, raw_data=None, extra: int = 0):
+                super().__init__(raw_data)
+                self.total = self.value + extra
+
+        class CustomChild(Custom):
+            label: str = 'child'
+
+        class GeneratedChild(CustomChild):
+            def __init__(self, raw_data=None):
+                Model.__init__(self, raw_data)
+
+        self.assertEqual(5, Custom({'value': 2}, extra=3).total)
+        self.assertEqual(4, Custom({'value': '4'}).total)
+        for _ in range(2):
+            child = CustomChild({'value': 1, 'label': 'x'}, extra=1)
+            self.assertEqual({'value': 1, 'total': 2, 'label': 'x'}, child.to_primitive())
+        self.assertEqual({'value': 3, 'total': 0, 'label': 'child'}, GeneratedChild({'value': 3}).to_primitive())
+        with self.assertRaises(ConversionError) as ctx:
+            CustomChild({'value': 'x'})
+        self.assertEqual({'value': ["Value 'x' is not an integer number"]}, ctx.exception.errors)
+
+    def test_sparse_input(self):
+        class Bud(Model):
+            type = 'bud'
+
+        class Sparse(Model):
+            required: Union[Leaf, Bud]
+            flag: bool = True
+            count: Optional[int] = None
+            items: List[int] = []
+            leaf: Leaf = Leaf
+            any: Any = AnyField(default={'nested': True})
+
+            @classmethod
+            def resolve_extra_types(cls) -> Set[Type[Model]]:
+                return {Bud}
+
+        class CustomSparse(Sparse):
+            def __init__(self, raw_data=None):
+                super().__init__(raw_data)
+
+        for model_type in (Sparse, CustomSparse):
+            model = model_type({'count': 3})
+            self.assertEqual({'flag': True, 'count': 3, 'items': [], 'leaf': {'color': 'green'},
+                              'any': {'nested': True}}, model.to_primitive())
+            self.assertIs(Missing, model.required)
+            self.assertIsNot(model.items, model_type().items)
+            self.assertIsNot(model.leaf, model_type().leaf)
+            with self.assertRaises(ConversionError) as ctx:
+                model_type({'items': ['x']})
+            self.assertEqual({'items': {'0': ["Value 'x' is not an integer number"]}}, ctx.exception.errors)
+
+    def test_atomic_input_types(self):
+        class Label(str):
+            pass
+
+        class Atomic(Model):
+            flag: bool
+            count: int
+            ratio: float
+            label: str
+
+        model = Atomic({'flag': True, 'count': 3, 'ratio': 0.5, 'label': 'x'})
+        self.assertEqual({'flag': True, 'count': 3, 'ratio': 0.5, 'label': 'x'}, model.to_primitive())
+        # Values of other types, including subclasses, are still converted
+        model = Atomic({'flag': 'yes', 'count': True, 'ratio': 2, 'label': Label('y')})
+        self.assertEqual([bool, int, float, str], [type(value) for _, value in model.items()])
+        self.assertEqual({'flag': True, 'count': 1, 'ratio': 2., 'label': 'y'}, model.to_primitive())
+
     def test_bad_field_type_typing(self):
         class BadType(Model):
             set: Set[int]
@@ -140,6 +216,28 @@ class TestModels(TestCase):
         self.assertEqual("Field bad of BadType: Unrecognized field annotation complex (may need an explicit Field)",
                          str(ctx.exception))
 
+    def test_bad_field_type_not_class(self):
+        class BadType(Model):
+            bad: NewType('UserId', int)
+
+        with self.assertRaises(ConfigurationError) as ctx:
+            BadType()
+        self.assertEqual("Field bad of BadType: Unrecognized field annotation UserId (may need an explicit Field)",
+                         str(ctx.exception))
+
+    def test_custom_field_type_not_class(self):
+        class NumberField(AnyField):
+            type = (int, float)
+
+        class UnionField(AnyField):
+            type = Union[int, str]
+
+        class CustomTypes(Model):
+            number: Any = NumberField()
+            union: Any = UnionField()
+
+        self.assertEqual('<CustomTypes {number=1, union=\'a\'}>', repr(CustomTypes({'number': 1, 'union': 'a'})))
+
     def test_multiple_non_abstract_bases(self):
         class Base1(Model):
             a: int
@@ -184,6 +282,72 @@ class TestModels(TestCase):
         self.assertNotEqual(1, model)
         self.assertNotEqual(None, model)
 
+    def test_custom_equality(self):
+        class Empty(Model):
+            pass
+
+        class Named(Model):
+            name: str
+            tags: List[str] = list
+
+        class CaseInsensitive(Named):
+            def __eq__(self, other):
+                return super().__eq__(other) or (type(self) is type(other) and self.name.lower() == other.name.lower()
+                                                 and self.tags == other.tags)
+
+        self.assertEqual(Empty(), Empty())
+        self.assertEqual(Named({'name': 'A', 'tags': ['x']}), Named({'name': 'A', 'tags': ['x']}))
+        self.assertNotEqual(Named({'name': 'A', 'tags': ['x']}), Named({'name': 'A', 'tags': ['y']}))
+        self.assertEqual(CaseInsensitive({'name': 'A'}), CaseInsensitive({'name': 'a'}))
+        self.assertEqual(CaseInsensitive({'name': 'A'}), CaseInsensitive({'name': 'A'}))
+        self.assertNotEqual(CaseInsensitive({'name': 'A'}), CaseInsensitive({'name': 'b'}))
+        self.assertNotEqual(CaseInsensitive({'name': 'A'}), Named({'name': 'A'}))
+
+    def test_hash(self):
+        class Named(Model):
+            name: str
+            tags: List[str] = list
+            leaf: Optional[Leaf] = None
+
+        class CustomHash(Named):
+            def __hash__(self):
+                return super().__hash__() ^ hash(tuple(self.tags))
+
+        class CustomEquality(Named):
+            def __eq__(self, other):
+                return super().__eq__(other)
+
+        first, second = Named({'name': 'a', 'tags': ['x'], 'leaf': {'color': 'red'}}), Named({'name': 'a'})
+        self.assertEqual(hash(first), hash(Named({'name': 'a', 'tags': ['x'], 'leaf': {'color': 'red'}})))
+        self.assertEqual(hash(first), hash(second))  # Only atomic fields are hashed, equality decides the rest
+        self.assertEqual(2, len({first, second, first.copy(deep=True)}))
+        self.assertNotEqual(hash(Named()), hash(Named({'name': 'b'})))
+        self.assertNotEqual(hash(first), hash(CustomHash(first.to_primitive())))
+        self.assertEqual(hash(CustomHash({'name': 'a'})), hash(CustomHash({'name': 'a'})))
+        with self.assertRaises(TypeError):
+            hash(CustomEquality())
+
+    def test_shared_annotation(self):
+        class First(Model):
+            values: Optional[List[int]] = list
+
+            def validate_values(self, value, _):
+                if len(value) > 1:
+                    raise ValueError('Too many')
+
+        class Second(Model):
+            values: Optional[List[int]] = None
+
+        first, second = First({'values': [1, 2]}), Second({'values': [1, 2]})
+        self.assertIsNot(First.__fields__[0], Second.__fields__[0])
+        self.assertEqual('<Field values of type Optional[List[int]], default=<None>>', repr(Second.__fields__[0]))
+        self.assertEqual([], First().values)
+        self.assertIsNone(Second().values)
+        with self.assertRaises(ValidationError) as ctx:
+            first.validate()
+        self.assertEqual({'values': ['Too many']}, ctx.exception.errors)
+        second.validate()
+
     def test_override_field_type(self):
         class First(Model):
             plain: int
@@ -287,6 +451,53 @@ class TestModels(TestCase):
         self.assertIs(Missing, deep_copy.missing)
         self.assertIs(Missing, copy(shallow_copy.missing))
 
+        model.missing = [{'set': {1}}]
+        model.missing.append(model.missing)  # Recursive structures are copied too
+        model.missing.append(model.missing[0])
+        deep_copy = model.copy(deep=True)
+        self.assertIsNot(model.missing[0]['set'], deep_copy.missing[0]['set'])
+        self.assertIs(deep_copy.missing, deep_copy.missing[1])
+        self.assertIsNot(model.missing[0], deep_copy.missing[0])
+        self.assertIs(deep_copy.missing[0], deep_copy.missing[2])
+
+    def test_custom_copy(self):
+        class Empty(Model):
+            pass
+
+        class Counted(Model):
+            values: List[int] = list
+            copies: int = 0
+
+            def copy(self, deep: bool = False) -> Model:
+                copied = super().copy(deep)
+                copied.copies = self.copies + 1
+                return copied
+
+        self.assertEqual(Empty(), Empty().copy(deep=True))
+        model = Counted({'values': [1]})
+        shallow, deep = model.copy(), model.copy(deep=True).copy(deep=True)
+        model.values.append(2)
+        self.assertEqual({'values': [1, 2], 'copies': 1}, shallow.to_primitive())
+        self.assertEqual({'values': [1], 'copies': 2}, deep.to_primitive())
+
+    def test_custom_validation_errors(self):
+        class Range(Model):
+            low: int
+            high: int
+
+            def validation_errors(self, context=None) -> Iterable[PathErrorType]:
+                yield from super().validation_errors(context)
+                if self.low is not Missing and self.high is not Missing and self.low > self.high:
+                    yield ('high',), 'Must not be lower than low'
+
+        Range({'low': 1, 'high': 2}).validate()
+        with self.assertRaises(ValidationError) as ctx:
+            Range({'low': 3, 'high': 2}).validate()
+        self.assertEqual({'high': ['Must not be lower than low']}, ctx.exception.errors)
+        with self.assertRaises(ValidationError) as ctx:
+            Range({'low': 3}).validate()
+        self.assertEqual({'high': ['This field is required']}, ctx.exception.errors)
+
     def test_any_field(self):
         class WithAny(Model):
             normal: Any
@@ -421,6 +632,17 @@ class TestModels(TestCase):
         self.assertEqual({}, copy(model).serialize())
         self.assertEqual({}, deepcopy(model).serialize())
 
+    def test_defaulted_field_set_to_missing(self):
+        class DefaultsMissing(Model):
+            number: int = 5
+            leaf: Optional[Leaf] = None
+            other: str = 'x'
+
+        model = DefaultsMissing()
+        model.number = Missing
+        model.leaf = Missing
+        self.assertEqual({'other': 'x'}, model.serialize())
+
     def test_explicit_field_no_annotation_error(self):
         with self.assertRaises(ConfigurationError) as ctx:
             class NoAnnotation(Model):
@@ -499,6 +721,41 @@ class TestModels(TestCase):
         with self.assertRaisesRegex(KeyError, "'extra_slot'"):
             self.fail(f'should raise: {incomplete_model["extra_slot"]}')
 
+    def test_keyword_field_names(self):
+        # Only dynamically created models can have such fields, their generated methods must use getattr/setattr
+        Keywords = cast(Type[Model], type('Keywords', (Model,), {'__annotations__': {'class': int, 'ok': int}}))
+        model = Keywords({'class': 1, 'ok': 2})
+        self.assertEqual({'class': 1, 'ok': 2}, model.to_primitive())
+        self.assertEqual(model, model.copy(deep=True))
+        self.assertEqual(hash(model), hash(model.copy()))
+        setattr(model, 'class', None)
+        with self.assertRaises(ValidationError) as ctx:
+            model.validate()
+        self.assertEqual({'class': ['This field is required']}, ctx.exception.errors)
+
+    def test_copy_field_slots(self):
+        class SingleSlotField(AnyField):
+            __slots__ = 'marker'
+
+        class SpecialSlotsField(SingleSlotField):
+            __slots__ = ('__private', '__weakref__', '__dict__', 'class')
+
+            def __init__(self):
+                super().__init__()
+                self.marker = 'single'
+                setattr(self, 'class', 'keyword')
+                self.__private = 'mangled'
+                self.extra = 'dict'
+
+            def private(self):
+                return self.__private
+
+        field = SpecialSlotsField()
+        copied = field.copy_field()
+        self.assertIsNot(field, copied)
+        self.assertEqual(('single', 'mangled', 'dict', 'keyword'),
+                         (copied.marker, copied.private(), copied.extra, getattr(copied, 'class')))
+
     def test_ensure_missing_coverage(self):
         # The only purpose of this test is to ensure 100% coverage for *dead* code, where possible
         self.assertEqual(1, IntField().to_primitive(1))
@@ -517,7 +774,46 @@ class TestModels(TestCase):
         fake_field.name = 'field'
         list(fake_field.validate(42, {}))
         fake_field.copy_value(42)
-        Temp.__fields__[0] = fake_field
+        Temp.__fields__ = (fake_field,)
 
         with self.assertRaises(AssertionError):
             DataError([])
+
+    def test_data_error_paths(self):
+        error = ConversionError.new('Bad value', 'field')
+        with self.assertRaises(ConversionError) as ctx:
+            error.wrapped('parent')
+        self.assertIsNot(error, ctx.exception)
+        self.assertEqual('parent: field: Bad value', str(ctx.exception))
+        self.assertEqual('field: Bad value', str(error))
+
+        # Errors not created by prepend_path are copied, further prepending modifies the copy in place
+        prepended = error.prepend_path('0')
+        self.assertIsNot(error, prepended)
+        self.assertEqual('field: Bad value', str(error))
+        self.assertEqual({'0': {'field': ['Bad value']}}, prepended.errors)
+        self.assertIs(prepended, prepended.prepend_path('root'))
+        self.assertEqual('root: 0: field: Bad value', str(prepended))
+        self.assertEqual({'root': {'0': {'field': ['Bad value']}}}, prepended.errors)
+
+    def test_reraised_conversion_error(self):
+        error = ConversionError.new('Always bad')
+
+        class AlwaysBadField(AnyField):
+            def convert(self, value: Any) -> Any:
+                if value is Missing:
+                    return value
+                raise error
+
+        class Reraising(Model):
+            a: Any = AlwaysBadField()
+            b: List[Any] = ListField(AlwaysBadField())
+
+        for _ in range(2):
+            with self.assertRaises(ConversionError) as ctx:
+                Reraising({'a': 1})
+            self.assertEqual([(('a',), 'Always bad')], ctx.exception.error_list)
+            with self.assertRaises(ConversionError) as ctx:
+                Reraising({'b': [1]})
+            self.assertEqual([(('b', '0'), 'Always bad')], ctx.exception.error_list)
+        self.assertEqual([((), 'Always bad')], error.error_list)
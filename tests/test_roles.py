@@ -66,6 +66,13 @@ class TestModels(TestCase):
         self.assertEqual([], MyChildRoles.field_names_for_role(ROLE_UNKNOWN_NONE))
         self.assertEqual([], OtherChildRoles.fields_for_role(ROLE_UNKNOWN_NONE))
 
+        # Results are cached, but each call returns a new list
+        names = MyChildRoles.field_names_for_role(ROLE_A)
+        names.append('modified')
+        MyChildRoles.fields_for_role(ROLE_A).clear()
+        self.assertEqual(['a1', 'a_2'], MyChildRoles.field_names_for_role(ROLE_A))
+        self.assertEqual(2, len(MyChildRoles.fields_for_role(ROLE_A)))
+
     def _assert_my_roles(self, model: Model):
         all_serialized = {'a1': 1, 'a_2': 2, 'b1': 1.1, 'b2': 2.2, 'c1': '1'}
         self.assertEqual(all_serialized, model.serialize(role=DEFAULT_ROLE))
@@ -235,6 +242,29 @@ class TestModels(TestCase):
         self.assertEqual("Role blacklist/whitelist needs member descriptors (e.g. cls.my_field), got 'not_a_field'",
                          str(ctx.exception))
 
+    def test_unconfigured_roles(self):
+        class Unconfigured(Model):
+            a1: int = 1
+            hidden: int = IntField(to_primitive_name=None, default=2)
+
+            @classmethod
+            def declare_roles(cls):
+                yield ROLE_C.blacklist(cls.a1)
+
+        # Roles with codes lower than that of a configured role
+        model = Unconfigured()
+        self.assertEqual({}, model.to_primitive(ROLE_B))
+        self.assertEqual([], Unconfigured.fields_for_role(ROLE_B))
+        self.assertEqual({'a1': 1}, model.to_primitive(ROLE_A))
+        self.assertEqual({}, model.to_primitive(ROLE_C))
+
+        # Roles created after the model was initialized
+        late_all, late_none = Role('late_all'), Role('late_none', empty_by_default=True)
+        self.assertEqual({'a1': 1}, model.to_primitive(late_all))
+        self.assertEqual(['a1'], Unconfigured.field_names_for_role(late_all))
+        self.assertEqual({}, model.to_primitive(late_none))
+        self.assertEqual([], Unconfigured.field_names_for_role(late_none))
+
     def test_role_repr(self):
         self.assertEqual('<Role default>', repr(DEFAULT_ROLE))
         self.assertEqual('<Role a>', repr(ROLE_A))
@@ -65,6 +65,22 @@ class TestSerializable(TestCase):
         self.assertEqual({}, model.serialize(role_b))
         model.validate()
 
+    def test_serializable_order(self):
+        class Base(Model):
+            field: int = 0
+
+            @serializable
+            def zeta(self) -> int:
+                return 1
+
+        class Derived(Base):
+            @serializable
+            def alpha(self) -> int:
+                return 2
+
+        # Fields first, then serializables sorted by name regardless of the class defining them
+        self.assertEqual(['field', 'alpha', 'zeta'], list(Derived().serialize()))
+
     def test_serializable_inheritance(self):
         class Abstract(Model):
             __abstract__ = True